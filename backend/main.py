@@ -8,7 +8,6 @@ bootstrap_runtime()
 
 import argparse
 import threading
-import queue
 import signal
 import sys
 
@@ -37,6 +36,7 @@ from protocols.x69_lg_video_mode import normalize_x69_video_mode
 
 from services.flight_controller import FlightController
 from services.video_receiver import VideoReceiverService
+from utils.spsc_ring import SpscRing
 from utils.wifi_uav_variants import WIFI_UAV_DRONE_TYPES, resolve_wifi_uav_variant
 from views.cli_rc import CLIView
 from views.opencv_video_view import OpenCVVideoView
@@ -256,7 +256,7 @@ def main():
                     "debug": x69_debug,
                 }
         
-        frame_queue = queue.Queue(maxsize=100)
+        frame_queue = SpscRing(100)
         video_receiver = VideoReceiverService(
             video_protocol_adapter_class, # The class to instantiate
             video_protocol_args,          # The arguments for it
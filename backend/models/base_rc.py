@@ -105,6 +105,14 @@ class BaseRCModel(ABC):
             axes.get("roll", 0),
         )
 
+    # (axis, last-direction attribute, reversal boost) for update_axes
+    _INCREMENTAL_AXES: ClassVar = (
+        ("throttle", "last_throttle_dir", False),
+        ("yaw",      "last_yaw_dir",      False),
+        ("pitch",    "last_pitch_dir",    True),
+        ("roll",     "last_roll_dir",     True),
+    )
+
     def update_axes(self, dt, throttle_dir, yaw_dir, pitch_dir, roll_dir):
         """
         Apply the shared incremental stick logic used by keyboard-style controls.
@@ -112,59 +120,51 @@ class BaseRCModel(ABC):
         Pitch and roll get a small immediate boost when the pilot reverses
         direction so the craft feels less sluggish during lateral movement.
         """
-        for attr, direction, boost_enabled in (
-            ("throttle", throttle_dir, False),
-            ("yaw", yaw_dir, False),
-            ("pitch", pitch_dir, True),
-            ("roll", roll_dir, True),
+        vmin   = self.min_control_value
+        vmax   = self.max_control_value
+        center = self.center_value
+        expo   = self.expo_factor
+        boost  = self.immediate_response
+        accel_step = self.accel_rate * dt
+        decel_step = self.decel_rate * dt
+        # expo and centring gains folded with the half-range divisors up front
+        up_expo     = expo / (vmax - center)
+        down_expo   = expo / (center - vmin)
+        up_centre   = 0.5 / (vmax - center)
+        down_centre = 0.5 / (center - vmin)
+
+        for (attr, last_dir_attr, boost_enabled), direction in zip(
+            self._INCREMENTAL_AXES, (throttle_dir, yaw_dir, pitch_dir, roll_dir)
         ):
             cur = getattr(self, attr)
-            last_dir_attr = f"last_{attr}_dir"
             last_dir = getattr(self, last_dir_attr, 0)
 
+            # Clamps are inline conditionals rather than min()/max() calls,
+            # which cost a builtin call each in the interpreter.
             if direction > 0:
                 if boost_enabled and last_dir <= 0:
-                    cur += min(
-                        self.max_control_value - cur,
-                        self.immediate_response,
-                    )
-                dist = self.max_control_value - cur
-                accel = self.accel_rate * dt * (
-                    1 + self.expo_factor * dist
-                    / (self.max_control_value - self.center_value)
-                )
-                new = min(self.max_control_value, cur + accel)
+                    cur = cur + boost if cur + boost < vmax else vmax
+                new = cur + accel_step * (1 + up_expo * (vmax - cur))
+                if new > vmax:
+                    new = vmax
 
             elif direction < 0:
                 if boost_enabled and last_dir >= 0:
-                    cur -= min(
-                        cur - self.min_control_value,
-                        self.immediate_response,
-                    )
-                dist = cur - self.min_control_value
-                accel = self.accel_rate * dt * (
-                    1 + self.expo_factor * dist
-                    / (self.center_value - self.min_control_value)
-                )
-                new = max(self.min_control_value, cur - accel)
-
+                    cur = cur - boost if cur - boost > vmin else vmin
+                new = cur - accel_step * (1 + down_expo * (cur - vmin))
+                if new < vmin:
+                    new = vmin
+
+            elif cur > center:
+                new = cur - decel_step * (1 + up_centre * (cur - center))
+                if new < center:
+                    new = center
+            elif cur < center:
+                new = cur + decel_step * (1 + down_centre * (center - cur))
+                if new > center:
+                    new = center
             else:
-                if cur > self.center_value:
-                    dist = cur - self.center_value
-                    decel = self.decel_rate * dt * (
-                        1 + 0.5 * dist
-                        / (self.max_control_value - self.center_value)
-                    )
-                    new = max(self.center_value, cur - decel)
-                elif cur < self.center_value:
-                    dist = self.center_value - cur
-                    decel = self.decel_rate * dt * (
-                        1 + 0.5 * dist
-                        / (self.center_value - self.min_control_value)
-                    )
-                    new = min(self.center_value, cur + decel)
-                else:
-                    new = cur
+                new = cur
 
             setattr(self, attr, new)
             setattr(self, last_dir_attr, direction)
@@ -2,7 +2,11 @@ import time
 
 class VideoFrame:
     """Model representing a video frame from the drone"""
-    
+
+    # One of these is created per frame on every video path; slots keep the
+    # object small and cheap to build and collect.
+    __slots__ = ("frame_id", "data", "format", "timestamp", "width", "height", "size")
+
     def __init__(self, frame_id, data, format_type="jpeg", timestamp=None):
         self.frame_id = frame_id
         self.data = data
@@ -1,9 +1,12 @@
+import struct
 from collections import defaultdict
 from typing import Dict, Optional
 
 from models.video_frame import VideoFrame
 from utils.wifi_uav_jpeg import generate_jpeg_headers, EOI
 
+_FRAGMENT_IDS = struct.Struct("<16xH14xH")  # frame counter, fragment index
+
 
 class WifiUavVideoModel:
     """
@@ -43,8 +46,7 @@ class WifiUavVideoModel:
             return None  # not a JPEG packet – ignore
 
         last_fragment = payload[2] != 0x38
-        frame_id = int.from_bytes(payload[16:18], "little")
-        fragment_id = int.from_bytes(payload[32:34], "little")
+        frame_id, fragment_id = _FRAGMENT_IDS.unpack_from(payload)
         jpeg_slice = payload[self.HEADER_LEN :]
 
         # 2. Start a new frame if necessary
@@ -61,10 +63,12 @@ class WifiUavVideoModel:
             self._expected_fragments is not None
             and len(self._fragments) == self._expected_fragments
         ):
-            ordered = (self._fragments[i] for i in range(self._expected_fragments))
-            full_jpeg = (
-                self._jpeg_header + b"".join(ordered) + bytes(EOI)
-            )  # ensure immutable bytes
+            # One join copies every byte once; chaining + would copy the
+            # payload again for the header and again for EOI.
+            parts = [self._jpeg_header]
+            parts.extend(self._fragments[i] for i in range(self._expected_fragments))
+            parts.append(EOI)
+            full_jpeg = b"".join(parts)  # immutable bytes
 
             # Prepare next frame
             self._reset_state(None)
@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import Iterator, Optional, Protocol
 from services.flight_controller import FlightController
 from models.video_frame import VideoFrame
 
+
+class OverlaySink(Protocol):
+    """Where plugins publish overlays (web_server.OverlayBroadcaster at runtime)."""
+
+    def put_nowait(self, data: list) -> None:
+        ...
+
+
 class Plugin(ABC):
     """
     Base class all runtime plug-ins must inherit from.
@@ -15,12 +23,12 @@ class Plugin(ABC):
                  name: str,
                  flight_controller: FlightController,
                  frame_source: Iterator,
-                 overlay_queue = None,
+                 overlay_sink: Optional[OverlaySink] = None,
                  **kwargs):
         self.name   = name
         self.fc     = flight_controller
         self.frames = frame_source
-        self.overlays = overlay_queue
+        self.overlays = overlay_sink
         self.running = False
         # Lifecycle guards: make stop() idempotent and ensure cleanup runs
         # even if subclasses flip `running` directly.
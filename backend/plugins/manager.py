@@ -4,20 +4,21 @@ import logging
 import pkgutil
 import queue
 import threading
-from typing import Dict, Iterator, Type
+from typing import Dict, Iterator, Optional, Type
 from services.flight_controller import FlightController
-from .base import Plugin
+from utils.latest_only import LatestOnly
+from .base import OverlaySink, Plugin
 
 logger = logging.getLogger(__name__)
 
 class PluginManager:
     def __init__(self,
                  flight_controller: FlightController,
-                 frame_queue: queue.Queue,
-                 overlay_queue: queue.Queue):
+                 frame_queue: LatestOnly,
+                 overlay_sink: Optional[OverlaySink]):
         self._fc      = flight_controller
         self._frames_q  = frame_queue
-        self._overlay_q = overlay_queue
+        self._overlay_sink = overlay_sink
         self._registry: Dict[str, Type[Plugin]] = {}
         self._pool: Dict[str, Plugin] = {}
         self._frame_stop_events: Dict[str, threading.Event] = {}
@@ -33,10 +34,10 @@ class PluginManager:
         """
         Clears any currently displayed overlays (frontend will render none).
         """
-        if not self._overlay_q:
+        if not self._overlay_sink:
             return
         try:
-            self._overlay_q.put_nowait([])
+            self._overlay_sink.put_nowait([])
         except Exception:
             pass
 
@@ -73,11 +74,11 @@ class PluginManager:
                     continue
 
         try:
-            # Pass a new, unique generator instance and the overlay queue to the plugin
+            # Pass a new, unique generator instance and the overlay sink to the plugin
             inst = cls(name=name,
                        flight_controller=self._fc,
                        frame_source=frame_iterator(),
-                       overlay_queue=self._overlay_q)
+                       overlay_sink=self._overlay_sink)
             inst.start()
             self._pool[name] = inst
             return True
@@ -20,6 +20,7 @@ from typing import Final, Optional, List
 from models.cooingdv_video_model import CooingdvVideoModel
 from models.video_frame import VideoFrame
 from protocols.base_video_protocol import BaseVideoProtocolAdapter
+from utils.jpeg_encoder import JpegEncoder
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,9 @@ class CooingdvVideoProtocolAdapter(BaseVideoProtocolAdapter):
         # Packet buffer for compatibility with existing interface
         self._pkt_lock = threading.Lock()
         self._pkt_buffer: List[bytes] = []
+
+        # OpenCV handles BGR→YCbCr conversion internally
+        self._encoder = JpegEncoder(quality=85)
         
         # Statistics
         self.frames_ok = 0
@@ -226,11 +230,11 @@ class CooingdvVideoProtocolAdapter(BaseVideoProtocolAdapter):
                 
                 self._last_frame_time = time.time()
                 
-                # Encode as JPEG (OpenCV handles BGR→YCbCr conversion internally)
-                encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 85]
-                _, jpeg_data = cv2.imencode('.jpg', frame, encode_param)
+                jpeg_data = self._encoder.encode(frame)
+                if jpeg_data is None:
+                    continue
                 
-                video_frame = self.handle_payload(jpeg_data.tobytes())
+                video_frame = self.handle_payload(jpeg_data)
                 if video_frame is None:
                     continue
 
@@ -7,7 +7,8 @@ from typing import Optional, List
 
 from models.video_frame import VideoFrame
 from protocols.base_video_protocol import BaseVideoProtocolAdapter
-from utils.dropping_queue import DroppingQueue
+from utils.jpeg_encoder import JpegEncoder
+from utils.spsc_ring import SpscRing
 
 log = logging.getLogger(__name__)
 
@@ -26,7 +27,8 @@ class DebugVideoProtocolAdapter(BaseVideoProtocolAdapter):
         self._frame_id = 0
         self._running = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self.frame_queue = DroppingQueue(maxsize=max_queue_size)
+        self.frame_queue = SpscRing(max_queue_size)
+        self._encoder = JpegEncoder(quality=85)
 
     def start(self):
         self._cap = cv2.VideoCapture(self.camera_index)
@@ -77,15 +79,15 @@ class DebugVideoProtocolAdapter(BaseVideoProtocolAdapter):
                 time.sleep(0.1)
                 continue
 
-            ok, jpg = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
-            if not ok:
+            jpg = self._encoder.encode(frame_bgr)
+            if jpg is None:
                 log.warning("[debug-video] JPEG encode failed")
                 continue
 
             self._frame_id = (self._frame_id + 1) & 0xFFFF
             video_frame = VideoFrame(
                 frame_id=self._frame_id,
-                data=jpg.tobytes(),
+                data=jpg,
                 format_type="jpeg",
             )
             
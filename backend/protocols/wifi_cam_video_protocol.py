@@ -14,6 +14,17 @@ from protocols.base_video_protocol import BaseVideoProtocolAdapter
 logger = logging.getLogger(__name__)
 
 
+class WifiCamVideoFrame(VideoFrame):
+    """JPEG frame plus the WiFi_CAM per-frame header fields."""
+
+    __slots__ = ("resolution", "retain")
+
+    def __init__(self, frame_id, data, resolution: int, retain: int):
+        super().__init__(frame_id, data, format_type="jpeg")
+        self.resolution = resolution
+        self.retain = retain
+
+
 class WifiCamVideoProtocolAdapter(BaseVideoProtocolAdapter):
     """Start the WiFi_CAM MJPEG stream and reassemble native JPEG chunks."""
 
@@ -230,7 +241,4 @@ class WifiCamVideoProtocolAdapter(BaseVideoProtocolAdapter):
             return None
 
         self._frame_counter = (self._frame_counter + 1) & 0xFFFF
-        frame = VideoFrame(self._frame_counter, data, format_type="jpeg")
-        frame.resolution = resolution  # type: ignore[attr-defined]
-        frame.retain = retain  # type: ignore[attr-defined]
-        return frame
+        return WifiCamVideoFrame(self._frame_counter, data, resolution, retain)
@@ -1,5 +1,6 @@
 import logging
 import socket
+import struct
 import queue
 import threading
 import time
@@ -12,11 +13,17 @@ from utils.wifi_uav_packets import (
     START_STREAM,
     build_native_ack_packet,
 )
+from utils.spsc_ring import SpscRing
+from utils.udp_socket import UdpBatchReceiver
 from utils.wifi_uav_jpeg import generate_jpeg_headers, EOI
 from utils.wifi_uav_variants import get_wifi_uav_capabilities
 
 logger = logging.getLogger(__name__)
 
+# Fragment header fields, read in place from the datagram (see handle_payload)
+_NATIVE_FRAGMENT_HEADER = struct.Struct("<2xH4xQ16xIII4xB")  # len, seq, frag, count, body len, quality
+_LEGACY_FRAGMENT_HEADER = struct.Struct("<16xH14xH")         # 16-bit frame id, fragment index
+
 
 class WifiUavVideoProtocolAdapter(BaseVideoProtocolAdapter):
     """
@@ -182,7 +189,7 @@ class WifiUavVideoProtocolAdapter(BaseVideoProtocolAdapter):
             return None
 
         # Only emit a frame once every fragment up to the announced tail exists.
-        jpeg = self._jpeg_header + slot.ordered_payload() + EOI
+        jpeg = slot.ordered_payload(self._jpeg_header, EOI)
         frame = VideoFrame(frame_id=frame_id, data=jpeg)
 
         self.frames_ok += 1
@@ -250,21 +257,16 @@ class WifiUavVideoProtocolAdapter(BaseVideoProtocolAdapter):
         if len(payload) < 56 or payload[0] != 0x93 or payload[1] != 0x01:
             return None
 
-        declared_len = int.from_bytes(payload[2:4], "little")
+        (declared_len, frame_id, frag_id, fragment_total,
+         frame_body_len, quality) = _NATIVE_FRAGMENT_HEADER.unpack_from(payload)
         native_layout = declared_len == len(payload)
         if native_layout:
-            frame_id = int.from_bytes(payload[8:16], "little")
-            frag_id = int.from_bytes(payload[32:36], "little")
-            fragment_total = int.from_bytes(payload[36:40], "little")
-            frame_body_len = int.from_bytes(payload[40:44], "little")
-            quality = payload[48]
             if fragment_total > 0 and frag_id < fragment_total:
                 return frame_id, frag_id, fragment_total, frame_body_len, quality, payload[56:]
 
         # Compatibility fallback for older captures/comments that only used
         # 16-bit counters and inferred the last fragment from packet length.
-        frame_id = int.from_bytes(payload[16:18], "little")
-        frag_id = int.from_bytes(payload[32:34], "little")
+        frame_id, frag_id = _LEGACY_FRAGMENT_HEADER.unpack_from(payload)
         # Legacy packets only reveal the total when the tail fragment arrives.
         fragment_total = frag_id + 1 if payload[2] != 0x38 else 0
         return frame_id, frag_id, fragment_total, 0, 0, payload[56:]
@@ -282,9 +284,16 @@ class WifiUavVideoProtocolAdapter(BaseVideoProtocolAdapter):
     def _create_duplex_socket(self) -> socket.socket:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Room for a whole fragment burst if the rx thread stalls briefly;
+        # Linux caps this at net.core.rmem_max unless that is raised.
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        except OSError:
+            pass
         sock.bind(("", 0))          # let OS choose a free local port
         sock.settimeout(1.0)
-        self._dbg(f"Main UDP socket created, listening on *:{sock.getsockname()[1]}")
+        self._dbg(f"Main UDP socket created, listening on *:{sock.getsockname()[1]} "
+                  f"(rcvbuf {sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)} bytes)")
         return sock
 
     def get_receiver_socket(self) -> socket.socket:
@@ -308,36 +317,36 @@ class WifiUavVideoProtocolAdapter(BaseVideoProtocolAdapter):
     def start(self) -> None:
         if hasattr(self, "_rx_thread") and self._rx_thread and self._rx_thread.is_alive():
             return
-        # Small frame buffer; upstream will drop if slow
-        self._frame_q: "queue.Queue[VideoFrame]" = queue.Queue(maxsize=2)
+        # Small lock-free frame buffer; the oldest frame is dropped if upstream is slow
+        self._frame_q: SpscRing = SpscRing(2)
         self._last_rx_ts = time.time()
         with self._pkt_lock:
             self._pkt_buffer = []
 
         def _rx_loop() -> None:
-            sock = self.get_receiver_socket()
+            # Each frame arrives as a burst of fragments; drain the whole
+            # burst per wake-up instead of one datagram per syscall.
+            receiver = UdpBatchReceiver(self.get_receiver_socket())
             while self._running:
                 try:
-                    payload = self.recv_from_socket(sock)
-                    if not payload:
-                        continue
-                    # Collect raw packet bytes for optional dumping
-                    with self._pkt_lock:
-                        self._pkt_buffer.append(payload)
-                    # Try to assemble a frame
-                    frame = self.handle_payload(payload)
-                    if frame is not None:
-                        try:
-                            self._frame_q.put(frame, timeout=0.2)
-                        except queue.Full:
-                            # Drop frame if consumer is slow
-                            pass
+                    payloads = receiver.recv()
                 except OSError:
                     # Socket likely closed during stop(); exit loop
                     break
-                except Exception as e:
-                    self._dbg(f"[wifi-uav] rx error: {e}")
+                if not payloads:
                     continue
+                # Collect raw packet bytes for optional dumping
+                with self._pkt_lock:
+                    self._pkt_buffer.extend(payloads)
+                for payload in payloads:
+                    try:
+                        # Try to assemble a frame
+                        frame = self.handle_payload(payload)
+                    except Exception as e:
+                        self._dbg(f"[wifi-uav] rx error: {e}")
+                        continue
+                    if frame is not None:
+                        self._frame_q.put(frame)
 
         self._rx_thread = threading.Thread(target=_rx_loop, daemon=True, name="WifiUavVideoRx")
         self._rx_thread.start()
@@ -22,6 +22,7 @@ import cv2
 from models.cooingdv_video_model import CooingdvVideoModel
 from models.video_frame import VideoFrame
 from protocols.base_video_protocol import BaseVideoProtocolAdapter
+from utils.jpeg_encoder import JpegEncoder
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,7 @@ class X69LgRtspVideoProtocolAdapter(BaseVideoProtocolAdapter):
             if jpeg_quality is not None
             else os.getenv("X69_LG_RTSP_JPEG_QUALITY", "85")
         )
+        self._encoder = JpegEncoder(self._jpeg_quality)
 
         self.debug = debug or logger.isEnabledFor(logging.DEBUG)
         self._dbg = logger.debug if self.debug else (lambda *a, **k: None)
@@ -195,9 +197,10 @@ class X69LgRtspVideoProtocolAdapter(BaseVideoProtocolAdapter):
                     continue
 
                 self._last_frame_time = time.time()
-                encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), self._jpeg_quality]
-                _, jpeg_data = cv2.imencode(".jpg", frame, encode_param)
-                video_frame = self.handle_payload(jpeg_data.tobytes())
+                jpeg_data = self._encoder.encode(frame)
+                if jpeg_data is None:
+                    continue
+                video_frame = self.handle_payload(jpeg_data)
                 if video_frame is None:
                     continue
 
@@ -2,6 +2,7 @@ import argparse
 import ipaddress
 import queue
 import socket
+import struct
 import threading
 import time
 import os
@@ -10,6 +11,10 @@ from datetime import datetime
 import cv2
 import numpy as np
 
+from utils.jpeg_decoder import decode_jpeg
+from utils.latest_only import LatestOnly
+from utils.udp_socket import UdpBatchReceiver
+
 ###############################################################################
 # Constants
 ###############################################################################
@@ -19,6 +24,7 @@ VIDEO_PORT      = 8888        # where the drone sends JPEG slices
 SOI_MARKER      = b"\xFF\xD8"
 EOI_MARKER      = b"\xFF\xD9"
 SYNC_BYTES      = b"\x40\x40"
+SYNC_WORD       = int.from_bytes(SYNC_BYTES, "little")
 
 # --------------------------------------------------------------------------- #
 # The drone's header (derived from packet dumps)
@@ -36,6 +42,8 @@ SYNC_BYTES      = b"\x40\x40"
 # • bytes 8+      … payload
 # --------------------------------------------------------------------------- #
 HEADER_LEN = 8
+# sync word, FID, (2 skipped), SID, byte 6, byte 7 – parsed in one call
+SLICE_HEADER = struct.Struct("<HBxxBBB")
 
 ###############################################################################
 # Small helper to discover the IP address of the interface that can reach
@@ -67,21 +75,34 @@ def send_start_command(drone_ip: str, my_ip: str):
 class ControlKeepAlive(threading.Thread):
     """
     Periodically re-send the start-video command so the drone keeps streaming.
+
+    Uses one UDP socket connected to the drone for the thread's lifetime
+    instead of opening a new one per keep-alive.
     """
     def __init__(self, drone_ip, my_ip, interval=1.0):
         super().__init__(daemon=True)
         self.drone_ip = drone_ip
         self.my_ip    = my_ip
         self.interval = interval
-        self._stop    = threading.Event()
+        self._payload = b"\x08" + ipaddress.IPv4Address(my_ip).packed
+        # not "_stop": that name is taken by threading.Thread internals
+        self._stopped = threading.Event()
 
     def run(self):
-        while not self._stop.is_set():
-            send_start_command(self.drone_ip, self.my_ip)
-            time.sleep(self.interval)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect((self.drone_ip, CONTROL_PORT))
+            # wait() returns as soon as stop() is called
+            while not self._stopped.wait(self.interval):
+                try:
+                    sock.send(self._payload)
+                except OSError as e:
+                    # e.g. ICMP port-unreachable surfacing on the connected socket
+                    print(f"[control] keep-alive send failed: {e}")
+                    continue
+                print(f"[control] start-cmd sent   ({self._payload.hex(' ')})")
 
     def stop(self):
-        self._stop.set()
+        self._stopped.set()
 
 ###############################################################################
 # 2. Video receiver thread – re-assemble slices into full JPEG frames
@@ -106,7 +127,10 @@ class VideoReceiver(threading.Thread):
 
         # assembly state
         self._cur_fid     = None
-        self._fragments   = {}     # sid_raw:int -> payload:bytes
+        self._fragments   = [None] * 256   # indexed by sid_raw; None = not yet seen
+        self._min_sid     = 256
+        self._max_sid     = -1
+        self._count       = 0
 
         if self.dump_packets:
             ts = int(time.time()*1000)
@@ -118,11 +142,17 @@ class VideoReceiver(threading.Thread):
     def _reset_frame(self, new_fid):
         """Forget the old frame and start a fresh one."""
         self._cur_fid   = new_fid
-        self._fragments.clear()
-
-    def _finalise_frame(self, fid, fragments):
-        # 1) stitch slices together in ascending order
-        data = b"".join(fragments[i] for i in sorted(fragments))
+        if self._count:
+            lo, hi = self._min_sid, self._max_sid
+            self._fragments[lo : hi + 1] = [None] * (hi - lo + 1)
+        self._min_sid   = 256
+        self._max_sid   = -1
+        self._count     = 0
+
+    def _finalise_frame(self, fid):
+        # 1) stitch slices together in ascending order (caller checked
+        #    that min_sid..max_sid has no gaps)
+        data = b"".join(self._fragments[self._min_sid : self._max_sid + 1])
 
         # 2) find the real JPEG in the bytes
         start = data.find(SOI_MARKER)
@@ -131,7 +161,8 @@ class VideoReceiver(threading.Thread):
             print(f"[receiver] JPEG markers missing on frame {fid}")
             return
 
-        jpeg = data[start : end + 2]
+        # zero-copy view; np.frombuffer() and file.write() both accept it
+        jpeg = memoryview(data)[start : end + 2]
 
         # 3) dump & push
         if self.dump_frames:
@@ -146,60 +177,62 @@ class VideoReceiver(threading.Thread):
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.bind(("0.0.0.0", self.port))
         sock.settimeout(1.0)
+        # drains each burst of slices with one recvmmsg() on Linux
+        receiver = UdpBatchReceiver(sock)
         print(f"[receiver] listening on UDP/*:{self.port}")
 
         try:
             while self.running.is_set():
-                try:
-                    pkt, addr = sock.recvfrom(2048)
-                except socket.timeout:
-                    continue
-
-                if self.dump_packets:
-                    self._pktlog.write(pkt)
-
-                # sanity‐check
-                if len(pkt) <= HEADER_LEN or pkt[:2] != SYNC_BYTES:
-                    continue
-
-                fid     = pkt[2]
-                sid_raw = pkt[5]
-                # if packet byte 7 and 8 are 0x78 and 0x05 respectively, then strip the 8 bytes
-                if pkt[6] == 0x78 and pkt[7] == 0x05:
-                    payload = pkt[8:]
-                else:
-                  payload = pkt[6:]
-
-                # strip trailing 0x23 0x23 if present
-                if payload.endswith(b"\x23\x23"):
-                    payload = payload[:-2]
-
-                if sid_raw % 20 == 0:   # throttle the spam
-                    head = payload[:8].hex()
-                    ascii_payload = payload[:8].decode('ascii', errors='replace')
-                    print(f"[slice] FID=0x{fid:02x} SID={sid_raw:3d} "
-                          f"head={head} ascii={ascii_payload!r}")
-
-                # new frame detected?
-                if self._cur_fid is None:
-                    self._reset_frame(fid)
-
-                elif fid != self._cur_fid:
-                    if self._fragments:
-                        keys = sorted(self._fragments)
-                        # simple completeness check
-                        if len(keys) == (keys[-1] - keys[0] + 1):
-                            self._finalise_frame(self._cur_fid, self._fragments)
-                        else:
-                            print(f"[receiver] dropping frame {self._cur_fid}, "
-                                  f"slices {keys[0]}..{keys[-1]} missing "
-                                  f"{(keys[-1]-keys[0]+1) - len(keys)}")
-
-                    self._reset_frame(fid)
-
-                # stash this slice (ignore dupes)
-                if sid_raw not in self._fragments:
-                    self._fragments[sid_raw] = payload
+                for pkt in receiver.recv():
+                    if self.dump_packets:
+                        self._pktlog.write(pkt)
+
+                    # sanity‐check
+                    n = len(pkt)
+                    if n <= HEADER_LEN:
+                        continue
+                    sync, fid, sid_raw, b6, b7 = SLICE_HEADER.unpack_from(pkt)
+                    if sync != SYNC_WORD:
+                        continue
+
+                    # if packet byte 7 and 8 are 0x78 and 0x05 respectively, then strip the 8 bytes
+                    start = 8 if b6 == 0x78 and b7 == 0x05 else 6
+                    # strip trailing 0x23 0x23 if present
+                    end = n - 2 if pkt[n - 1] == 0x23 and pkt[n - 2] == 0x23 else n
+                    # a view, not a copy: the only copy is the join in _finalise_frame
+                    payload = memoryview(pkt)[start:end]
+
+                    if sid_raw % 20 == 0:   # throttle the spam
+                        head = payload[:8].hex()
+                        ascii_payload = bytes(payload[:8]).decode('ascii', errors='replace')
+                        print(f"[slice] FID=0x{fid:02x} SID={sid_raw:3d} "
+                              f"head={head} ascii={ascii_payload!r}")
+
+                    # new frame detected?
+                    if self._cur_fid is None:
+                        self._reset_frame(fid)
+
+                    elif fid != self._cur_fid:
+                        if self._count:
+                            lo, hi = self._min_sid, self._max_sid
+                            # simple completeness check
+                            if self._count == (hi - lo + 1):
+                                self._finalise_frame(self._cur_fid)
+                            else:
+                                print(f"[receiver] dropping frame {self._cur_fid}, "
+                                      f"slices {lo}..{hi} missing "
+                                      f"{(hi-lo+1) - self._count}")
+
+                        self._reset_frame(fid)
+
+                    # stash this slice (ignore dupes)
+                    if self._fragments[sid_raw] is None:
+                        self._fragments[sid_raw] = payload
+                        self._count += 1
+                        if sid_raw < self._min_sid:
+                            self._min_sid = sid_raw
+                        if sid_raw > self._max_sid:
+                            self._max_sid = sid_raw
 
         finally:
             sock.close()
@@ -208,9 +241,42 @@ class VideoReceiver(threading.Thread):
             print("[receiver] stopped")
 
 ###############################################################################
-# 3. Display loop (main thread) – show frames with OpenCV
+# 3. Decoder thread – JPEG -> BGR off the UI thread
 ###############################################################################
-def display_frames(frame_q: queue.Queue):
+class FrameDecoder(threading.Thread):
+    """
+    Decode reassembled JPEGs so imshow()/waitKey() never wait on libjpeg.
+    Decoding releases the GIL, so this overlaps with the display loop.
+    Only the newest decoded image is kept for display.
+    """
+    def __init__(self, frame_queue: queue.Queue, image_queue: LatestOnly):
+        super().__init__(daemon=True)
+        self.frame_q = frame_queue
+        self.image_q = image_queue
+        self.running = threading.Event()
+        self.running.set()
+
+    def run(self):
+        while self.running.is_set():
+            try:
+                jpeg = self.frame_q.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+            frame = decode_jpeg(jpeg)
+            if frame is None:
+                print(f"[decoder] ⚠ decode failed ({len(jpeg)} bytes)")
+                continue
+            print(f"[decoder] decoded frame {frame.shape}")
+            self.image_q.put(frame)
+
+    def stop(self):
+        self.running.clear()
+
+###############################################################################
+# 4. Display loop (main thread) – show frames with OpenCV
+###############################################################################
+def display_frames(image_q: LatestOnly):
     cv2.namedWindow("Drone", cv2.WINDOW_NORMAL)
 
     # build a single placeholder image (black + red warning text)
@@ -227,24 +293,17 @@ def display_frames(frame_q: queue.Queue):
     frame_count = 0
 
     while True:
-        jpeg = None
+        frame = None
         try:
-            jpeg = frame_q.get(timeout=1.0)
+            frame = image_q.get(timeout=1.0)
         except queue.Empty:
             pass
 
-        if jpeg is None:
+        if frame is None:
             img = placeholder
             is_real = False
         else:
-            arr = np.frombuffer(jpeg, dtype=np.uint8)
-            frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-            if frame is None:
-                print(f"[display] ⚠ imdecode failed ({len(arr)} bytes)")
-                img, is_real = placeholder, False
-            else:
-                print(f"[display] decoded frame {frame.shape}")
-                img, is_real = frame, True
+            img, is_real = frame, True
 
         cv2.imshow("Drone", img)
         key = cv2.waitKey(1) & 0xFF
@@ -296,7 +355,9 @@ def main():
     keepalive.start()
 
     # 3. Start receiver thread (pass dump flags)
-    frame_q = queue.Queue(maxsize=100)
+    # latest JPEG wins: a stalled decoder skips stale frames instead of
+    # working through a backlog of them
+    frame_q = LatestOnly()
     receiver = VideoReceiver(
         frame_q,
         port=args.video_port,
@@ -305,14 +366,22 @@ def main():
     )
     receiver.start()
 
-    # 4. UI loop
+    # 4. Decoder thread
+    image_q = LatestOnly()
+    decoder = FrameDecoder(frame_q, image_q)
+    decoder.start()
+
+    # 5. UI loop
     try:
-        display_frames(frame_q)
+        display_frames(image_q)
     finally:
         print("[main] shutting down …")
         keepalive.stop()
         receiver.stop()
+        decoder.stop()
+        keepalive.join()
         receiver.join()
+        decoder.join()
 
 if __name__ == "__main__":
     main()
@@ -46,6 +46,12 @@ class DroneController:
         # Exponential control factor (higher values = more aggressive response)
         self.expo_factor = 0.8
 
+        # reused 20-byte control packet: 0x66 header, 0x99 trailer,
+        # bytes 8-17 stay zero; build_packet_hy() rewrites the rest
+        self._pkt = bytearray(20)
+        self._pkt[0]  = 0x66
+        self._pkt[19] = 0x99
+
     def update_axes(self, dt, throttle_dir, yaw_dir, pitch_dir, roll_dir):
         """Apply acceleration or deceleration for each axis."""
         for attr, direction, boost_enabled in (
@@ -108,44 +114,34 @@ class DroneController:
             return (value - self.min_control_value) * 128.0 / (self.center_value - self.min_control_value)
 
     def build_packet_hy(self):
-        pkt = bytearray(20)
-        pkt[0] = 0x66
+        """Fill and return the reused control packet (valid until the next call)."""
+        pkt = self._pkt
         pkt[1] = self.speed & 0xFF
 
         # Cast floats back to ints with CORRECTED ORDER
         # Remap from our constrained range to full 0-255 range
-        pkt[2] = int(self.remap_to_full_range(self.roll))     & 0xFF
-        pkt[3] = int(self.remap_to_full_range(self.pitch))    & 0xFF  
-        pkt[4] = int(self.remap_to_full_range(self.throttle)) & 0xFF
-        pkt[5] = int(self.remap_to_full_range(self.yaw))      & 0xFF
+        roll     = int(self.remap_to_full_range(self.roll))     & 0xFF
+        pitch    = int(self.remap_to_full_range(self.pitch))    & 0xFF
+        throttle = int(self.remap_to_full_range(self.throttle)) & 0xFF
+        yaw      = int(self.remap_to_full_range(self.yaw))      & 0xFF
 
         # FIXED: flags in byte 6 and 7 were reversed compared to mobile app
-        # Byte 6 should be 0x00
-        pkt[6] = 0x00
-        
-        # Handle one-shot flags
-        if self.takeoff:
-            pkt[6] |= 0x01
-        if self.land:
-            pkt[6] |= 0x02
-        if self.stop:
-            pkt[6] |= 0x04
-
-        # Byte 7 should be 0x0a
-        pkt[7] = 0x0a  # Base value is 0x0a
-        
-        # record flag
-        if self.record:
-            pkt[7] |= (self.record << 2)
-
-        # bytes 8-17 = 0 (zero-filled)
-
-        # checksum over bytes 2-17
-        chk = 0
-        for i in range(2, 18):
-            chk ^= pkt[i]
-        pkt[18] = chk & 0xFF
-        pkt[19] = 0x99
+        # Byte 6 should be 0x00, plus the one-shot flags
+        flags6 = (0x01 if self.takeoff else 0) | (0x02 if self.land else 0) | (0x04 if self.stop else 0)
+
+        # Byte 7 should be 0x0a (base value), plus the record flag
+        flags7 = (0x0a | (self.record << 2)) & 0xFF
+
+        pkt[2] = roll
+        pkt[3] = pitch
+        pkt[4] = throttle
+        pkt[5] = yaw
+        pkt[6] = flags6
+        pkt[7] = flags7
+
+        # bytes 8-17 = 0 (never written), so the checksum over bytes 2-17
+        # reduces to bytes 2-7
+        pkt[18] = roll ^ pitch ^ throttle ^ yaw ^ flags6 ^ flags7
 
         # clear one-shots
         self.takeoff = self.land = self.stop = False
@@ -5,7 +5,7 @@ import time
 import os
 import logging
 
-from utils.dropping_queue import DroppingQueue
+from utils.spsc_ring import SpscRing
 from models.video_frame import VideoFrame
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ class VideoReceiverService:
     ):
         self.protocol_adapter_class = protocol_adapter_class
         self.protocol_adapter_args = protocol_adapter_args
-        self.frame_queue = frame_queue or DroppingQueue(maxsize=max_queue_size)
+        self.frame_queue = frame_queue or SpscRing(max_queue_size)
         self.dump_frames = dump_frames
         self.dump_packets = dump_packets
         self.rc_adapter = rc_adapter
@@ -0,0 +1,66 @@
+import asyncio
+import unittest
+
+from web_server import ConnectionManager
+
+
+class _FakeWebSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(message)
+
+
+class ConnectionManagerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_client_does_not_delay_others(self):
+        manager = ConnectionManager()
+        fast, slow = _FakeWebSocket(), _FakeWebSocket(delay=0.5)
+        await manager.connect(fast)
+        await manager.connect(slow)
+
+        await manager.broadcast("hello")
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(fast.sent, ["hello"])
+        self.assertEqual(slow.sent, [])
+        manager.disconnect(fast)
+        manager.disconnect(slow)
+
+    async def test_failed_client_is_pruned(self):
+        manager = ConnectionManager()
+        good, bad = _FakeWebSocket(), _FakeWebSocket(fail=True)
+        await manager.connect(good)
+        await manager.connect(bad)
+
+        await manager.broadcast_json([{"type": "rect"}])
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(good.sent, ['[{"type":"rect"}]'])
+        self.assertEqual(manager.active_connections, (good,))
+        manager.disconnect(good)
+
+    async def test_backlogged_client_keeps_newest_messages(self):
+        manager = ConnectionManager()
+        slow = _FakeWebSocket(delay=0.05)
+        await manager.connect(slow)
+
+        for i in range(ConnectionManager.OUTBOX_SIZE + 5):
+            await manager.broadcast(str(i))
+        await asyncio.sleep(0.05 * (ConnectionManager.OUTBOX_SIZE + 3))
+
+        self.assertEqual(slow.sent[-1], str(ConnectionManager.OUTBOX_SIZE + 4))
+        self.assertLessEqual(len(slow.sent), ConnectionManager.OUTBOX_SIZE + 1)
+        manager.disconnect(slow)
+
+
+if __name__ == "__main__":
+    unittest.main()
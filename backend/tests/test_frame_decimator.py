@@ -0,0 +1,47 @@
+import unittest
+
+from utils.frame_decimator import FrameDecimator
+
+
+class FrameDecimatorTests(unittest.TestCase):
+    def test_forwards_every_frame_while_consumer_keeps_up(self):
+        decimator = FrameDecimator()
+        admitted = 0
+        for _ in range(20):
+            decimator.observe(0.1)
+            admitted += decimator.admit()
+
+        self.assertEqual(decimator.stride, 1)
+        self.assertEqual(admitted, 20)
+
+    def test_stride_doubles_under_sustained_backpressure_up_to_cap(self):
+        decimator = FrameDecimator(patience=2, max_stride=8)
+        for _ in range(2):
+            decimator.observe(0.9)
+        self.assertEqual(decimator.stride, 2)
+
+        for _ in range(20):
+            decimator.observe(1.0)
+        self.assertEqual(decimator.stride, 8)
+
+    def test_stride_halves_once_queue_drains(self):
+        decimator = FrameDecimator(patience=1, max_stride=16)
+        for _ in range(4):
+            decimator.observe(1.0)
+        self.assertEqual(decimator.stride, 16)
+
+        decimator.observe(0.5)
+        self.assertEqual(decimator.stride, 16)
+        decimator.observe(0.0)
+        self.assertEqual(decimator.stride, 8)
+
+    def test_admits_one_frame_per_stride(self):
+        decimator = FrameDecimator()
+        decimator.stride = 4
+        admitted = [decimator.admit() for _ in range(8)]
+
+        self.assertEqual(admitted.count(True), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from utils.jpeg_decoder import decode_jpeg
+
+
+class DecodeJpegTests(unittest.TestCase):
+    def test_decodes_bytes_and_memoryview_to_bgr(self):
+        ok, jpg = cv2.imencode(".jpg", np.full((16, 24, 3), (255, 0, 0), np.uint8))
+        self.assertTrue(ok)
+        data = jpg.tobytes()
+
+        for buf in (data, memoryview(b"\x00" + data)[1:]):
+            img = decode_jpeg(buf)
+            self.assertEqual(img.shape, (16, 24, 3))
+            self.assertGreater(img[8, 12, 0], 200)
+
+    def test_garbage_returns_none(self):
+        self.assertIsNone(decode_jpeg(b"not a jpeg"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import queue
+import threading
+import time
+import unittest
+
+from utils.latest_only import LatestOnly
+
+
+class LatestOnlyTests(unittest.TestCase):
+    def test_newest_item_replaces_unconsumed_one(self):
+        slot = LatestOnly()
+        slot.put("old")
+        slot.put_nowait("new")
+
+        self.assertEqual(slot.qsize(), 1)
+        self.assertEqual(slot.get_nowait(), "new")
+        self.assertTrue(slot.empty())
+
+    def test_empty_slot_raises_queue_empty(self):
+        slot = LatestOnly()
+
+        with self.assertRaises(queue.Empty):
+            slot.get_nowait()
+        with self.assertRaises(queue.Empty):
+            slot.get(timeout=0.01)
+
+    def test_blocked_get_wakes_on_put_from_another_thread(self):
+        slot = LatestOnly()
+        timer = threading.Timer(0.05, slot.put, args=("frame",))
+        timer.start()
+        try:
+            started = time.monotonic()
+            self.assertEqual(slot.get(timeout=2.0), "frame")
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            timer.cancel()
+
+    def test_none_is_a_valid_item(self):
+        slot = LatestOnly()
+        slot.put(None)
+
+        self.assertIsNone(slot.get(timeout=0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from models.s2x_rc import S2xDroneModel
+
+
+class IncrementalUpdateAxesTests(unittest.TestCase):
+    def test_held_stick_ramps_to_limit_and_recentres_on_release(self):
+        model = S2xDroneModel()
+        for _ in range(200):
+            model.update_axes(0.05, 1, -1, 0, 0)
+
+        self.assertEqual(model.throttle, model.max_control_value)
+        self.assertEqual(model.yaw, model.min_control_value)
+        self.assertEqual(model.pitch, model.center_value)
+
+        for _ in range(200):
+            model.update_axes(0.05, 0, 0, 0, 0)
+
+        self.assertEqual(model.throttle, model.center_value)
+        self.assertEqual(model.yaw, model.center_value)
+
+    def test_pitch_and_roll_get_reversal_boost_but_throttle_does_not(self):
+        model = S2xDroneModel()
+        model.update_axes(0.0, 1, 0, 1, 0)
+
+        self.assertEqual(model.throttle, model.center_value)
+        self.assertAlmostEqual(model.pitch, model.center_value + model.immediate_response)
+        self.assertEqual(model.last_pitch_dir, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
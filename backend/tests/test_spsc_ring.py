@@ -0,0 +1,34 @@
+import queue
+import unittest
+
+from utils.spsc_ring import SpscRing
+
+
+class SpscRingTests(unittest.TestCase):
+    def test_items_come_out_in_order(self):
+        ring = SpscRing(4)
+        for i in range(3):
+            ring.put(i)
+
+        self.assertEqual([ring.get_nowait() for _ in range(3)], [0, 1, 2])
+        self.assertTrue(ring.empty())
+
+    def test_full_ring_drops_oldest(self):
+        ring = SpscRing(2)
+        for i in range(5):
+            ring.put_nowait(i)
+
+        self.assertTrue(ring.full())
+        self.assertEqual(ring.qsize(), 2)
+        self.assertEqual(ring.get_nowait(), 3)
+        self.assertEqual(ring.get_nowait(), 4)
+        with self.assertRaises(queue.Empty):
+            ring.get(timeout=0.01)
+
+    def test_rejects_non_positive_capacity(self):
+        with self.assertRaises(ValueError):
+            SpscRing(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import socket
+import time
+import unittest
+
+from utils.udp_socket import UdpBatchReceiver
+
+
+class UdpBatchReceiverTests(unittest.TestCase):
+    def setUp(self):
+        self.rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.rx.bind(("127.0.0.1", 0))
+        self.rx.settimeout(0.05)
+        self.tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def tearDown(self):
+        self.tx.close()
+        self.rx.close()
+
+    def test_burst_is_received_in_order(self):
+        receiver = UdpBatchReceiver(self.rx, batch=8)
+        sent = [bytes([i]) * (i + 1) for i in range(20)]
+        for payload in sent:
+            self.tx.sendto(payload, self.rx.getsockname())
+        time.sleep(0.05)
+
+        received = []
+        while True:
+            batch = receiver.recv()
+            if not batch:
+                break
+            self.assertLessEqual(len(batch), 8)
+            received.extend(batch)
+
+        self.assertEqual(received, sent)
+
+    def test_timeout_returns_empty_and_closed_socket_raises(self):
+        receiver = UdpBatchReceiver(self.rx)
+        self.assertEqual(receiver.recv(), [])
+
+        self.rx.close()
+        with self.assertRaises(OSError):
+            receiver.recv()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from utils.wifi_uav_ack_state import WifiUavAckState
+from utils.wifi_uav_jpeg import EOI
+
+
+class WifiUavAckStateAssemblyTests(unittest.TestCase):
+    def test_out_of_order_fragments_assemble_between_header_and_eoi(self):
+        state = WifiUavAckState()
+        self.assertIsNone(state.ingest_fragment(7, 1, 3, b"bb"))
+        self.assertIsNone(state.ingest_fragment(7, 2, 3, b"cc"))
+        slot = state.ingest_fragment(7, 0, 3, b"aa")
+
+        self.assertIsNotNone(slot)
+        self.assertEqual(slot.ordered_payload(b"HDR", EOI), b"HDRaabbcc\xff\xd9")
+        self.assertEqual(slot.ordered_payload(), b"aabbcc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import struct
+import unittest
+
+from web_server import _decode_binary_control
+
+
+class BinaryControlFrameTests(unittest.TestCase):
+    def test_axes_frame_maps_to_json_shape(self):
+        frame = b"\x02" + struct.pack("<ffff", 0.5, -1.0, 0.25, 0.0)
+
+        self.assertEqual(
+            _decode_binary_control(frame),
+            {"type": "axes", "mode": "inc", "throttle": 0.5, "yaw": -1.0, "pitch": 0.25, "roll": 0.0},
+        )
+
+    def test_command_frames(self):
+        self.assertEqual(_decode_binary_control(b"\x03"), {"type": "takeoff"})
+        self.assertEqual(_decode_binary_control(b"\x04"), {"type": "land"})
+        self.assertEqual(_decode_binary_control(b"\x05"), {"type": "estop"})
+
+    def test_rejects_truncated_and_unknown_frames(self):
+        self.assertIsNone(_decode_binary_control(b""))
+        self.assertIsNone(_decode_binary_control(b"\x01\x00\x00"))
+        self.assertIsNone(_decode_binary_control(b"\x7f"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+class FrameDecimator:
+    """
+    Geometric frame skipping for a downstream consumer that can't keep up.
+
+    Feed the consumer's queue fill ratio to `observe()` once per frame and
+    forward the frame only if `admit()` returns True. While the queue stays
+    above `high_water` for `patience` frames in a row the stride doubles
+    (every 2nd, 4th, ... frame up to `max_stride`); once it drains below
+    `low_water` the stride halves again.
+    """
+
+    def __init__(
+        self,
+        high_water: float = 0.8,
+        low_water: float = 0.3,
+        patience: int = 5,
+        max_stride: int = 16,
+    ):
+        self.high_water = high_water
+        self.low_water = low_water
+        self.patience = max(1, int(patience))
+        self.max_stride = max(1, int(max_stride))
+        self.stride = 1
+        self._consecutive_full = 0
+        self._index = 0
+
+    def observe(self, fill_ratio: float) -> None:
+        if fill_ratio > self.high_water:
+            self._consecutive_full += 1
+            if self._consecutive_full >= self.patience:
+                self.stride = min(self.stride * 2, self.max_stride)
+                self._consecutive_full = 0
+            return
+
+        self._consecutive_full = 0
+        if fill_ratio < self.low_water and self.stride > 1:
+            self.stride //= 2
+
+    def admit(self) -> bool:
+        self._index += 1
+        return self._index % self.stride == 0
@@ -0,0 +1,35 @@
+import logging
+from typing import Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Decode-side counterpart of jpeg_encoder: libjpeg-turbo's SIMD IDCT and
+# colour conversion via PyTurboJPEG when the native library is installed,
+# OpenCV's bundled codec otherwise.
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+
+    _TURBO: Optional["TurboJPEG"] = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _TURBO = None
+
+logger.debug("[jpeg-decoder] using %s", "libjpeg-turbo" if _TURBO else "OpenCV")
+
+
+def decode_jpeg(data) -> Optional[np.ndarray]:
+    """
+    Decode a JPEG (bytes, bytearray or memoryview) to a BGR image.
+
+    Returns None if the data can't be decoded, like cv2.imdecode. A frame
+    libjpeg-turbo rejects is retried with OpenCV, which is more lenient
+    with the truncated frames a lossy UDP link produces.
+    """
+    if _TURBO is not None:
+        try:
+            return _TURBO.decode(data, pixel_format=TJPF_BGR)
+        except Exception:
+            pass
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
@@ -0,0 +1,56 @@
+import logging
+from typing import Optional
+
+import cv2
+
+logger = logging.getLogger(__name__)
+
+# libjpeg-turbo's SIMD encoder is noticeably faster than OpenCV's bundled
+# codec. It's optional: PyTurboJPEG needs the native library installed too.
+try:
+    from turbojpeg import TJSAMP_420, TurboJPEG
+
+    _TURBO: Optional["TurboJPEG"] = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _TURBO = None
+
+
+class JpegEncoder:
+    """
+    Re-encodes decoded BGR frames (webcam, RTSP) into JPEG for the MJPEG path.
+
+    The adapters that decode a stream locally all funnel through this class,
+    so the encode parameters are built once per stream instead of per frame.
+    Uses libjpeg-turbo through PyTurboJPEG when available, OpenCV otherwise.
+    """
+
+    def __init__(self, quality: int = 85):
+        self.quality = max(1, min(100, int(quality)))
+        self._params = [
+            int(cv2.IMWRITE_JPEG_QUALITY), self.quality,
+            int(cv2.IMWRITE_JPEG_OPTIMIZE), 0,
+        ]
+        self._turbo = _TURBO
+        logger.debug("[jpeg-encoder] using %s", "libjpeg-turbo" if self._turbo else "OpenCV")
+
+    def encode(self, frame_bgr) -> Optional[bytes | memoryview]:
+        """
+        Return the JPEG for `frame_bgr`, or None if encoding failed.
+
+        On the OpenCV path the result is a flat byte view over the array
+        OpenCV allocated for the encode, so the JPEG isn't copied again into a
+        separate bytes object.
+        """
+        if self._turbo is not None:
+            try:
+                return self._turbo.encode(
+                    frame_bgr, quality=self.quality, jpeg_subsample=TJSAMP_420
+                )
+            except Exception as e:
+                logger.warning("[jpeg-encoder] libjpeg-turbo encode failed, using OpenCV: %s", e)
+                self._turbo = None
+
+        ok, jpg = cv2.imencode(".jpg", frame_bgr, self._params)
+        if not ok:
+            return None
+        return memoryview(jpg).cast("B")
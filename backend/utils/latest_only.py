@@ -0,0 +1,15 @@
+from utils.spsc_ring import SpscRing
+
+
+class LatestOnly(SpscRing):
+    """
+    Single-slot, latest-item-wins hand-off between threads.
+
+    For "latest frame wins" pipelines only the newest item matters: a put
+    replaces any item the consumer hasn't taken yet. This is an SpscRing of
+    capacity one, so it shares its lock-free fast path and queue.Queue-style
+    API.
+    """
+
+    def __init__(self):
+        super().__init__(1)
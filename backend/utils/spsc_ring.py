@@ -0,0 +1,73 @@
+import queue
+import threading
+import time
+from collections import deque
+
+
+class SpscRing:
+    """
+    Bounded single-producer/single-consumer ring that drops the oldest item
+    when full.
+
+    The frame paths have exactly one producer thread and one consumer thread,
+    so queue.Queue's mutex and condition variable are pure overhead. The
+    ring is a deque(maxlen=capacity): append (evicting the oldest item when
+    full) and popleft are atomic in CPython, so the fast path takes no lock.
+    A threading.Event only wakes a consumer that is blocked waiting.
+
+    Implements the subset of the queue.Queue API the pipeline relies on, and
+    raises queue.Empty the same way. put never blocks.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.maxsize = capacity
+        self._ring: deque = deque(maxlen=capacity)
+        self._ready = threading.Event()
+
+    def put(self, item, block=True, timeout=None) -> None:
+        """Append `item`, dropping the oldest one if the ring is full."""
+        self._ring.append(item)
+        self._ready.set()
+
+    def put_nowait(self, item) -> None:
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        try:
+            return self._ring.popleft()
+        except IndexError:
+            if not block:
+                raise queue.Empty
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Clear before the re-check so a put landing in between still
+            # leaves the event set for the wait below.
+            self._ready.clear()
+            try:
+                return self._ring.popleft()
+            except IndexError:
+                pass
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            if not self._ready.wait(remaining):
+                try:
+                    return self._ring.popleft()
+                except IndexError:
+                    raise queue.Empty
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._ring)
+
+    def empty(self) -> bool:
+        return not self._ring
+
+    def full(self) -> bool:
+        return len(self._ring) >= self.maxsize
@@ -1,9 +1,12 @@
-"""UDP socket helpers (mainly Windows ICMP / WSAECONNRESET quirks)."""
+"""UDP socket helpers (Windows ICMP / WSAECONNRESET quirks, batched receive)."""
 
 from __future__ import annotations
 
 import ctypes
+import errno
+import os
 import platform
+import select
 import socket
 
 
@@ -19,3 +22,99 @@ def disable_udp_connreset(sock: socket.socket) -> None:
         sock.ioctl(SIO_UDP_CONNRESET, ctypes.c_ulong(0))
     except OSError:
         pass
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    if platform.system() != "Linux":
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_recvmmsg = _load_recvmmsg()
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+
+class UdpBatchReceiver:
+    """
+    Reads every datagram already queued on a UDP socket in one call.
+
+    A JPEG frame arrives as a burst of dozens of datagrams, and recvfrom()
+    on a socket with a timeout costs a poll() plus a recv() per datagram.
+    On Linux this waits once (honouring the socket timeout) and then pulls
+    up to `batch` datagrams with a single recvmmsg(2) into preallocated
+    buffers. Elsewhere it falls back to one recvfrom() per call.
+
+    `recv()` returns a list of payloads, empty on timeout, and raises
+    OSError once the socket is closed.
+    """
+
+    def __init__(self, sock: socket.socket, batch: int = 32, bufsize: int = 4096):
+        self._sock = sock
+        self._bufsize = bufsize
+        self._batch = batch if _recvmmsg is not None else 1
+        if _recvmmsg is None:
+            return
+
+        self._buf = ctypes.create_string_buffer(batch * bufsize)
+        base = ctypes.addressof(self._buf)
+        self._iovecs = (_IoVec * batch)()
+        self._msgs = (_MMsgHdr * batch)()
+        for i in range(batch):
+            self._iovecs[i].iov_base = base + i * bufsize
+            self._iovecs[i].iov_len = bufsize
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+        self._poller = select.poll()
+        self._poller.register(sock, select.POLLIN)
+
+    def recv(self) -> list[bytes]:
+        if _recvmmsg is None:
+            try:
+                pkt, _ = self._sock.recvfrom(self._bufsize)
+            except socket.timeout:
+                return []
+            return [pkt]
+
+        fd = self._sock.fileno()
+        if fd < 0:
+            raise OSError(errno.EBADF, "socket is closed")
+        timeout = self._sock.gettimeout()
+        if not self._poller.poll(None if timeout is None else timeout * 1000):
+            return []
+
+        n = _recvmmsg(fd, self._msgs, self._batch, _MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        base = ctypes.addressof(self._buf)
+        size = self._bufsize
+        return [ctypes.string_at(base + i * size, self._msgs[i].msg_len) for i in range(n)]
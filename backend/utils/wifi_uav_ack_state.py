@@ -70,8 +70,12 @@ class WifiUavFrameSlot:
             and all(i in self.fragments for i in range(self.fragment_total))
         )
 
-    def ordered_payload(self) -> bytes:
-        return b"".join(self.fragments[i] for i in range(self.fragment_total))
+    def ordered_payload(self, prefix: bytes = b"", suffix: bytes = b"") -> bytes:
+        """Fragments in order, wrapped in `prefix`/`suffix` with a single copy."""
+        parts = [prefix]
+        parts.extend(self.fragments[i] for i in range(self.fragment_total))
+        parts.append(suffix)
+        return b"".join(parts)
 
     def mark_delivered(self) -> None:
         self.status = SLOT_DELIVERED
@@ -1,3 +1,5 @@
+import functools
+import struct
 from typing import List
 
 # Start Of Image
@@ -31,6 +33,12 @@ std_chrominance_qt = [
 ]
 # fmt: on
 
+# Segment layouts, compiled once. Each segment is emitted by a single pack().
+_DQT_8BIT = struct.Struct(">2sHB64B")
+_DQT_16BIT = struct.Struct(">2sHB64H")
+_SOF0_HEADER = struct.Struct(">2sHBHHB")
+_COMPONENT_SPEC = struct.Struct(">BBB")
+
 
 def generate_dqt_segment(id: int, table: List[int], precision: int = 0) -> bytes:
     """
@@ -50,27 +58,14 @@ def generate_dqt_segment(id: int, table: List[int], precision: int = 0) -> bytes
     if precision not in (0, 1):
         raise ValueError("Precision must be 0 (8-bit) or 1 (16-bit).")
 
-    segment = bytearray(b"\xff\xdb")  # Marker
-    payload = bytearray()
-
+    layout = _DQT_8BIT if precision == 0 else _DQT_16BIT
+    # Length covers itself, the info byte and the table, not the marker.
+    length = layout.size - 2
     # Info byte: (precision << 4) | table_id
-    payload.append((precision << 4) | id)
-
-    # Add table data
-    if precision == 0:
-        payload.extend(table)
-    else:
-        for val in table:
-            payload.extend(val.to_bytes(2, "big"))
-
-    # Length = 2 (for length field itself) + payload size
-    length = len(payload) + 2
-    segment.extend(length.to_bytes(2, "big"))
-    segment.extend(payload)
-
-    return bytes(segment)
+    return layout.pack(b"\xff\xdb", length, (precision << 4) | id, *table)
 
 
+@functools.lru_cache(maxsize=4)
 def generate_sof0_segment(width: int, height: int, num_components: int = 3) -> bytes:
     """
     Generates a SOF0 (Start of Frame, Baseline DCT) segment for a JPEG image.
@@ -95,12 +90,6 @@ def generate_sof0_segment(width: int, height: int, num_components: int = 3) -> b
     if num_components not in (1, 3):
         raise ValueError("Number of components must be 1 or 3.")
 
-    marker = b"\xff\xc0"  # SOF0 marker
-    precision = b"\x08"  # 8-bit sample precision
-    height_bytes = height.to_bytes(2, "big")
-    width_bytes = width.to_bytes(2, "big")
-    num_components_byte = num_components.to_bytes(1, "big")
-
     # Default component layout
     if num_components == 1:
         component_info = [{"id": 1, "sampling": (1, 1), "qt_id": 0}]
@@ -113,29 +102,20 @@ def generate_sof0_segment(width: int, height: int, num_components: int = 3) -> b
     else:
         raise ValueError("Invalid num_components")
 
-    # Build component specs
-    component_specs = b""
-    for comp in component_info:
-        comp_id = comp["id"].to_bytes(1, "big")
-        H, V = comp["sampling"]
-        sampling_byte = ((H << 4) | V).to_bytes(1, "big")
-        qt_id = comp["qt_id"].to_bytes(1, "big")
-        component_specs += comp_id + sampling_byte + qt_id
-
     # Total length = 8 (header) + 3 bytes per component
-    length = (8 + 3 * num_components).to_bytes(2, "big")
-
-    return (
-        marker
-        + length
-        + precision
-        + height_bytes
-        + width_bytes
-        + num_components_byte
-        + component_specs
+    length = 8 + 3 * num_components
+    # SOF0 marker, 8-bit sample precision
+    header = _SOF0_HEADER.pack(b"\xff\xc0", length, 8, height, width, num_components)
+    component_specs = b"".join(
+        _COMPONENT_SPEC.pack(
+            comp["id"], (comp["sampling"][0] << 4) | comp["sampling"][1], comp["qt_id"]
+        )
+        for comp in component_info
     )
+    return header + component_specs
 
 
+@functools.lru_cache(maxsize=4)
 def generate_sos_segment(
     num_components: int, Ss: int = 0, Se: int = 63, AhAl: int = 0
 ) -> bytes:
@@ -162,28 +142,30 @@ def generate_sos_segment(
     else:
         raise ValueError("Component count must be 1 or 3.")
 
-    marker = b"\xff\xda"
     length = 6 + 2 * num_components
-    segment = bytearray(marker)
-    segment += length.to_bytes(2, "big")
-    segment.append(num_components)
-
+    selectors = []
     for comp in component_selectors:
-        table_selector = (comp["dc"] << 4) | comp["ac"]
-        segment.append(comp["id"])
-        segment.append(table_selector)
+        selectors += (comp["id"], (comp["dc"] << 4) | comp["ac"])
+
+    return struct.pack(
+        f">2sHB{2 * num_components}BBBB",
+        b"\xff\xda", length, num_components, *selectors, Ss, Se, AhAl,
+    )
 
-    segment.append(Ss)
-    segment.append(Se)
-    segment.append(AhAl)
 
-    return bytes(segment)
+# The quantization tables never change, so their DQT segments are built once.
+LUMINANCE_DQT_BYTES = generate_dqt_segment(id=0, table=std_luminance_qt)
+CHROMINANCE_DQT_BYTES = generate_dqt_segment(id=1, table=std_chrominance_qt)
 
 
+@functools.lru_cache(maxsize=4)
 def generate_jpeg_headers(width: int, height: int, num_components: int = 3) -> bytes:
     """
     Generates a minimal JPEG header without Huffman tables and default quantization tables.
 
+    The result depends only on the arguments and is cached, so reconnects and
+    new stream adapters reuse the same immutable header.
+
     Args:
         width (int): Image width in pixels.
         height (int): Image height in pixels.
@@ -193,8 +175,6 @@ def generate_jpeg_headers(width: int, height: int, num_components: int = 3) -> b
         bytes: JPEG header bytes (SOI, DQT, SOF0, SOS).
     """
     # Generate segments
-    luminance_dqt = generate_dqt_segment(id=0, table=std_luminance_qt)
-    chrominance_dqt = generate_dqt_segment(id=1, table=std_chrominance_qt)
     sof = generate_sof0_segment(
         width=width, height=height, num_components=num_components
     )
@@ -203,9 +183,9 @@ def generate_jpeg_headers(width: int, height: int, num_components: int = 3) -> b
     # Build the header
     header = bytearray()
     header += SOI
-    header += luminance_dqt
+    header += LUMINANCE_DQT_BYTES
     if num_components == 3:
-        header += chrominance_dqt
+        header += CHROMINANCE_DQT_BYTES
     header += sof
     header += sos
     return bytes(header)
@@ -1,3 +1,5 @@
+import struct
+
 # Start Video Feed
 START_STREAM = b"\xef\x00\x04\x00"
 
@@ -70,15 +72,17 @@ def build_fragment_ack_bitmap(fragment_total: int, received_fragments: set[int])
     return b"".join(word.to_bytes(4, "little") for word in words)
 
 
+_ACK_SLOT_HEADER = struct.Struct("<QII")  # seq, status, record length
+
+
 def build_ack_slot(seq: int, status: int, bitmap: bytes = b"") -> bytes:
     """Build one native ACK slot record."""
-    record_len = 16 + len(bitmap)
-    return (
-        (seq & 0xFFFFFFFFFFFFFFFF).to_bytes(8, "little")
-        + (status & 0xFFFFFFFF).to_bytes(4, "little")
-        + record_len.to_bytes(4, "little")
-        + bitmap
-    )
+    record_len = _ACK_SLOT_HEADER.size + len(bitmap)
+    return _ACK_SLOT_HEADER.pack(
+        seq & 0xFFFFFFFFFFFFFFFF,
+        status & 0xFFFFFFFF,
+        record_len,
+    ) + bitmap
 
 
 def build_native_ack_packet(
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import queue
 import signal
 import sys
 import os
@@ -8,6 +7,7 @@ import os
 from protocols.s2x_video_protocol import S2xVideoProtocolAdapter
 from protocols.wifi_uav_video_protocol import WifiUavVideoProtocolAdapter
 from services.video_receiver import VideoReceiverService
+from utils.spsc_ring import SpscRing
 from views.opencv_video_view import OpenCVVideoView
 
 def main():
@@ -54,7 +54,7 @@ def main():
     # }
     
     # Create frame queue
-    frame_queue = queue.Queue(maxsize=100)
+    frame_queue = SpscRing(100)
     
     # The service now takes the class and args to manage the protocol's lifecycle.
     receiver = VideoReceiverService(
@@ -4,14 +4,26 @@ import queue
 import time
 import sys
 import ctypes
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from utils.jpeg_decoder import decode_jpeg
 from views.base_video_view import BaseVideoView
 
+
+# Tiny real JPEG decoded once at start-up so libjpeg-turbo's lazy init
+# (SIMD detection, tables) is not paid on the first drone frame.
+_WARMUP_JPEG = cv2.imencode(".jpg", np.zeros((16, 16, 3), np.uint8))[1].tobytes()
+
+
 class OpenCVVideoView(BaseVideoView):
     """OpenCV-based video display view"""
     
-    def __init__(self, frame_queue, window_name="Drone Video"):
+    def __init__(self, frame_queue, window_name="Drone Video", decode_workers=2):
         super().__init__(frame_queue)
         self.window_name = window_name
+        # JPEG decoding releases the GIL, so a small thread pool decodes
+        # back-to-back frames in parallel while results are shown in order.
+        self.decode_workers = max(1, decode_workers)
         
     # ------------------------------------------------------------------ #
     # private helper – poke HighGUI so waitKey() returns immediately
@@ -42,24 +54,44 @@ class OpenCVVideoView(BaseVideoView):
         
         fps_timer = time.time()
         frame_count = 0
+
+        decoder = ThreadPoolExecutor(max_workers=self.decode_workers,
+                                     thread_name_prefix="JpegDecode")
+        pending = deque()   # (frame, future) in arrival order
+        decoder.submit(decode_jpeg, _WARMUP_JPEG)
         
         while self.running:
+            # Top up the decode pipeline; only block when nothing is in flight
+            while len(pending) < self.decode_workers:
+                try:
+                    if pending:
+                        frame = self.frame_queue.get_nowait()
+                    else:
+                        frame = self.frame_queue.get(timeout=1.0)
+                except queue.Empty:
+                    break
+                # Fallen behind the producer: skip to the newest frames
+                # instead of decoding a backlog that is already stale.
+                if self.frame_queue.qsize() >= self.decode_workers - len(pending):
+                    continue
+                future = None
+                if frame.format == "jpeg":
+                    future = decoder.submit(decode_jpeg, frame.data)
+                pending.append((frame, future))
+
             frame = None
-            try:
-                frame = self.frame_queue.get(timeout=1.0)
-            except queue.Empty:
-                pass
+            if pending:
+                frame, future = pending.popleft()
             
             if frame is None:
                 img = placeholder
                 is_real = False
             else:
                 # Handle different frame formats
-                if frame.format == "jpeg":
-                    arr = np.frombuffer(frame.data, dtype=np.uint8)
-                    decoded = cv2.imdecode(arr, cv2.IMREAD_COLOR)
+                if future is not None:
+                    decoded = future.result()
                     if decoded is None:
-                        print(f"[display] ⚠ imdecode failed ({len(arr)} bytes)")
+                        print(f"[display] ⚠ decode failed ({len(frame.data)} bytes)")
                         img, is_real = placeholder, False
                     else:
                         img, is_real = decoded, True
@@ -84,6 +116,7 @@ class OpenCVVideoView(BaseVideoView):
                     print(f"[display] ~{frame_count/(now-fps_timer):4.1f} fps")
                     fps_timer, frame_count = now, 0
         
+        decoder.shutdown(wait=False, cancel_futures=True)
         cv2.destroyAllWindows()
 
     def stop(self):
@@ -1,15 +1,16 @@
 import asyncio
 import threading
 import queue
-import time
+import struct
+from collections import deque
 from contextlib import asynccontextmanager
 from typing import Any, Optional
 import logging
 import os
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.websockets import WebSocketState
 from utils.logging_config import bootstrap_runtime, configure_logging
 
 bootstrap_runtime()
@@ -41,7 +42,9 @@ from protocols.x69_lg_rtsp_video_protocol import X69LgRtspVideoProtocolAdapter
 from protocols.x69_lg_jpeg_video_protocol import X69LgJpegVideoProtocolAdapter
 from protocols.x69_lg_video_mode import normalize_x69_video_mode
 from plugins.manager import PluginManager
-from utils.dropping_queue import DroppingQueue
+from models.video_frame import VideoFrame
+from utils.frame_decimator import FrameDecimator
+from utils.latest_only import LatestOnly
 from utils.wifi_uav_variants import (
     WIFI_UAV_DRONE_TYPES,
     resolve_wifi_uav_capabilities,
@@ -54,44 +57,74 @@ COOINGDV_DRONE_TYPES = {"cooingdv", "cooingdv_jieli"}
 class ConnectionManager:
     """
     Manages active WebSocket connections for broadcasting messages.
+
+    Every client gets a small outbound queue drained by its own writer task.
+    A broadcast only enqueues, so one slow client can't hold up the rest of
+    the fan-out; when a client falls behind its oldest pending message is
+    dropped, which caps the memory it can pin.
     """
+    SEND_TIMEOUT_S = 5.0
+    OUTBOX_SIZE = 4
+
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self._clients: dict[WebSocket, tuple[asyncio.Queue, asyncio.Task]] = {}
+        # Copy-on-write snapshots, rebuilt only on connect/disconnect. Readers
+        # take a reference instead of copying, and a broadcast doesn't
+        # re-check every socket's state.
+        self.active_connections: tuple[WebSocket, ...] = ()
+        self._outboxes: tuple[asyncio.Queue, ...] = ()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=self.OUTBOX_SIZE)
+        writer = asyncio.create_task(self._writer(websocket, outbox))
+        self._clients[websocket] = (outbox, writer)
+        self.active_connections = (*self.active_connections, websocket)
+        self._outboxes = (*self._outboxes, outbox)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        client = self._clients.pop(websocket, None)
+        if client is None:
+            return
+        outbox, writer = client
+        self.active_connections = tuple(c for c in self.active_connections if c is not websocket)
+        self._outboxes = tuple(q for q in self._outboxes if q is not outbox)
+        if writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocket, outbox: asyncio.Queue) -> None:
+        while True:
+            method, payload = await outbox.get()
+            try:
+                await asyncio.wait_for(getattr(websocket, method)(payload), timeout=self.SEND_TIMEOUT_S)
+            except Exception:
+                self.disconnect(websocket)
+                return
+
+    def _fan_out(self, method: str, payload) -> None:
+        message = (method, payload)
+        for outbox in self._outboxes:
+            try:
+                outbox.put_nowait(message)
+            except asyncio.QueueFull:
+                outbox.get_nowait()
+                outbox.put_nowait(message)
 
     async def broadcast(self, message: str):
-        # Copy to avoid mutation during iteration
-        for connection in list(self.active_connections):
-            if connection.client_state == WebSocketState.CONNECTED:
-                try:
-                    await connection.send_text(message)
-                except Exception:
-                    self.disconnect(connection)
+        self._fan_out("send_text", message)
 
     async def broadcast_bytes(self, message: bytes):
-        # Copy to avoid mutation during iteration
-        for connection in list(self.active_connections):
-            if connection.client_state == WebSocketState.CONNECTED:
-                try:
-                    await connection.send_bytes(message)
-                except Exception:
-                    self.disconnect(connection)
+        self._fan_out("send_bytes", message)
 
     async def broadcast_json(self, obj: Any):
-        # Copy to avoid mutation during iteration
-        for connection in list(self.active_connections):
-            if connection.client_state == WebSocketState.CONNECTED:
-                try:
-                    await connection.send_json(obj)
-                except Exception:
-                    self.disconnect(connection)
+        # Serialise once and share the payload instead of letting every
+        # send_json() re-encode the same object.
+        self._fan_out("send_text", _encode_json(obj))
+
+
+def _encode_json(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+
 
 # Feature flags
 PLUGINS_ENABLED = os.getenv("PLUGINS_ENABLED", "false").lower() in ("1", "true", "yes", "on")
@@ -196,49 +229,113 @@ def _apply_camera_tilt_command(model: Any, data: dict[str, Any]) -> None:
     if callable(setter):
         setter(tilt_state)
 
-class FrameHub:
+# Multipart framing for /mjpeg.
+_MJPEG_PART_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_MJPEG_PART_TRAILER = b"\r\n"
+
+class FrameSlot:
     """
-    Fan-out hub for MJPEG frames.
+    Single-frame mailbox for one /mjpeg client.
 
-    Each /mjpeg client gets its own asyncio.Queue, so multiple clients don't
-    steal frames from each other.
+    A newer frame simply overwrites one the client hasn't picked up yet, so
+    slow clients always get the latest frame instead of a stale backlog.
     """
-    def __init__(self, per_client_queue_size: int = 2):
-        self._per_client_queue_size = per_client_queue_size
-        self._clients: set[asyncio.Queue] = set()
-        self._lock = asyncio.Lock()
-
-    async def register(self) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue(self._per_client_queue_size)
-        async with self._lock:
-            self._clients.add(q)
-        return q
-
-    async def unregister(self, q: asyncio.Queue) -> None:
-        async with self._lock:
-            self._clients.discard(q)
-
-    async def publish(self, frame: Optional[bytes]) -> None:
-        # Snapshot under lock; we only do non-blocking puts.
-        async with self._lock:
-            clients = list(self._clients)
-
-        for q in clients:
-            try:
-                q.put_nowait(frame)
-            except asyncio.QueueFull:
-                # Drop oldest then try again.
-                try:
-                    _ = q.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                try:
-                    q.put_nowait(frame)
-                except Exception:
-                    # Give up on this client queue; it's likely stalled.
-                    await self.unregister(q)
+    __slots__ = ("_event", "_frame")
+
+    def __init__(self):
+        self._event = asyncio.Event()
+        self._frame: Optional[bytes] = None
 
-FRAME_HUB = FrameHub(per_client_queue_size=2)
+    def put(self, frame: Optional[bytes]) -> None:
+        self._frame = frame
+        self._event.set()
+
+    async def get(self) -> Optional[bytes]:
+        await self._event.wait()
+        self._event.clear()
+        # Hand the reference over so an idle client doesn't pin a frame.
+        frame, self._frame = self._frame, None
+        return frame
+
+
+class FrameHub:
+    """
+    Single fan-out point for video frames.
+
+    Each /mjpeg client gets its own FrameSlot, so multiple clients don't
+    steal frames from each other. Thread consumers (plugins) subscribe with
+    register_sync() and receive frames on a LatestOnly slot instead. Client
+    sets are immutable tuples that register/unregister swap out, so publish
+    never needs a lock.
+
+    Worker threads hand frames over with publish_threadsafe(), which parks
+    them in a small deque and wakes the event loop at most once per batch
+    instead of scheduling a coroutine per frame. /mjpeg clients receive the
+    frame already wrapped as a multipart part, built once and shared.
+    """
+    def __init__(self, inbox_size: int = 4):
+        self._clients: tuple[FrameSlot, ...] = ()
+        self._sync_clients: tuple[LatestOnly, ...] = ()
+        self._inbox: deque = deque(maxlen=inbox_size)
+        self._drain_pending = threading.Event()
+        # A drain still pending when the next frame arrives means the event
+        # loop is falling behind; thin out /mjpeg frames until it catches up.
+        self._loop_decimator = FrameDecimator()
+
+    def register(self) -> FrameSlot:
+        slot = FrameSlot()
+        self._clients = (*self._clients, slot)
+        return slot
+
+    def unregister(self, slot: FrameSlot) -> None:
+        self._clients = tuple(c for c in self._clients if c is not slot)
+
+    def register_sync(self) -> LatestOnly:
+        """Subscribe a thread consumer; frames arrive on the returned slot."""
+        slot = LatestOnly()
+        self._sync_clients = (*self._sync_clients, slot)
+        return slot
+
+    def unregister_sync(self, slot: LatestOnly) -> None:
+        self._sync_clients = tuple(c for c in self._sync_clients if c is not slot)
+
+    def publish(self, frame: Optional[bytes]) -> None:
+        """Deliver a multipart part to every async client. Must run on the event loop."""
+        for slot in self._clients:
+            slot.put(frame)
+
+    def publish_threadsafe(self, frame: Optional[VideoFrame], loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Deliver `frame` from a worker thread: thread consumers get it right
+        away, async clients on `loop`. None (end of stream) only reaches the
+        async clients.
+        """
+        if frame is not None:
+            # Latest-wins slots: an unread frame is simply replaced, so a
+            # busy consumer always picks up the newest one next.
+            for slot in self._sync_clients:
+                slot.put_nowait(frame)
+            if not self._clients:
+                return
+            self._loop_decimator.observe(1.0 if self._drain_pending.is_set() else 0.0)
+            if not self._loop_decimator.admit():
+                return
+            part = _MJPEG_PART_HEADER + frame.data + _MJPEG_PART_TRAILER
+        else:
+            part = None
+
+        self._inbox.append(part)
+        if not self._drain_pending.is_set():
+            self._drain_pending.set()
+            loop.call_soon_threadsafe(self._drain_inbox)
+
+    def _drain_inbox(self) -> None:
+        # Clear first: a frame appended after this point schedules a new drain.
+        self._drain_pending.clear()
+        while self._inbox:
+            self.publish(self._inbox.popleft())
+
+FRAME_HUB = FrameHub()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -250,6 +347,7 @@ async def lifespan(app: FastAPI):
     control_capabilities = _control_capabilities_for_drone(drone_type)
     
     logger.info("[main] Using drone type: %s", drone_type)
+    logger.info("[main] Event loop: %s", type(asyncio.get_running_loop()).__module__)
 
     if drone_type == "s2x":
         logger.info("[main] Using S2X drone implementation.")
@@ -469,16 +567,18 @@ async def lifespan(app: FastAPI):
     flight_controller.start()
 
     # 3. Plugins (optional)
-    plugin_frame_q: Optional[queue.Queue] = None
+    plugin_frame_q: Optional[LatestOnly] = None
     overlay_broadcaster: Optional["OverlayBroadcaster"] = None
     if PLUGINS_ENABLED:
-        PLUGIN_FRAME_Q = DroppingQueue(maxsize=100)
-        PLUGIN_OVERLAY_Q = DroppingQueue(maxsize=100)
-        plugin_manager = PluginManager(flight_controller, PLUGIN_FRAME_Q, PLUGIN_OVERLAY_Q)
+        # Plugins only ever act on the newest frame and the newest overlay
+        # snapshot. Frames come from the same hub that feeds /mjpeg; overlays
+        # go straight to the broadcaster task on the event loop.
+        PLUGIN_FRAME_Q = FRAME_HUB.register_sync()
+        overlay_broadcaster = OverlayBroadcaster(asyncio.get_running_loop())
+        plugin_manager = PluginManager(flight_controller, PLUGIN_FRAME_Q, overlay_broadcaster)
         plugin_frame_q = PLUGIN_FRAME_Q
 
         # Start overlay broadcaster only when plugins are enabled
-        overlay_broadcaster = OverlayBroadcaster(PLUGIN_OVERLAY_Q, asyncio.get_running_loop())
         overlay_broadcaster.start()
         logger.info("[plugins] Plugins enabled")
     else:
@@ -490,7 +590,7 @@ async def lifespan(app: FastAPI):
     main_loop = asyncio.get_running_loop()
     _pump_thread = threading.Thread(
         target=_frame_pump_worker,
-        args=(RAW_Q, plugin_frame_q, FRAME_HUB, _pump_stop, main_loop),
+        args=(RAW_Q, FRAME_HUB, _pump_stop, main_loop),
         name="FramePump",
         daemon=True,
     )
@@ -500,7 +600,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     if overlay_broadcaster:
-        overlay_broadcaster.stop()
+        await overlay_broadcaster.stop()
     if plugin_manager:
         plugin_manager.stop_all()
     if flight_controller:
@@ -511,15 +611,22 @@ async def lifespan(app: FastAPI):
         _pump_stop.set()
     if _pump_thread:
         _pump_thread.join(timeout=1.0)
+    if plugin_frame_q is not None:
+        FRAME_HUB.unregister_sync(plugin_frame_q)
 
 # ───────────────────────────────────────────────────────────────
 # FastAPI app + permissive CORS (tighten in production!)
 # ───────────────────────────────────────────────────────────────
 app = FastAPI(title="Drone web adapter", lifespan=lifespan)
 
+# CORS only applies to plain HTTP: the middleware hands WebSocket scopes
+# straight through and runs once per connection, never per message. Set
+# CORS_ALLOW_ORIGINS (comma-separated) to restrict the origins outside dev.
+_cors_origins = [o.strip() for o in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",") if o.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # TODO: restrict in prod
+    allow_origins=_cors_origins or ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -527,7 +634,7 @@ app.add_middleware(
 # ───────────────────────────────────────────────────────────────
 # Global objects (single-drone)
 # ───────────────────────────────────────────────────────────────
-RAW_Q: queue.Queue = DroppingQueue(maxsize=2)          # thread-safe → pump
+RAW_Q = LatestOnly()                                   # thread-safe → pump
 
 flight_controller: Optional[FlightController] = None
 receiver: Optional[VideoReceiverService] = None
@@ -559,6 +666,11 @@ async def get_plugins():
         "running": plugin_manager.running(),
     }
 
+# Plugin start/stop runs off the event loop (loading a detector model can take
+# seconds and would freeze /mjpeg and /ws meanwhile); the lock keeps requests
+# serialised the way running them on the loop used to.
+_plugin_lifecycle_lock = asyncio.Lock()
+
 @app.post("/plugins/{name}/start")
 async def start_plugin(name: str):
     if not PLUGINS_ENABLED:
@@ -566,16 +678,17 @@ async def start_plugin(name: str):
     if not plugin_manager:
         raise HTTPException(status_code=503, detail="PluginManager not available")
     try:
-        # Current architecture can technically run multiple plugins, but they
-        # will compete for frames from the shared plugin frame queue. For now
-        # we enforce a single running plugin for predictable behavior.
-        running = plugin_manager.running()
-        if running and name not in running:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Another plugin is already running: {running}. Stop it first.",
-            )
-        started = plugin_manager.start(name)
+        async with _plugin_lifecycle_lock:
+            # Current architecture can technically run multiple plugins, but they
+            # will compete for frames from the shared plugin frame queue. For now
+            # we enforce a single running plugin for predictable behavior.
+            running = plugin_manager.running()
+            if running and name not in running:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Another plugin is already running: {running}. Stop it first.",
+                )
+            started = await asyncio.to_thread(plugin_manager.start, name)
         if not started:
             raise HTTPException(status_code=409, detail="Plugin already running")
         return {"status": "started", "name": name}
@@ -591,7 +704,8 @@ async def stop_plugin(name: str):
     if not plugin_manager:
         raise HTTPException(status_code=503, detail="PluginManager not available")
     try:
-        stopped = plugin_manager.stop(name)
+        async with _plugin_lifecycle_lock:
+            stopped = await asyncio.to_thread(plugin_manager.stop, name)
         if not stopped:
             raise HTTPException(status_code=409, detail="Plugin not running")
         return {"status": "stopped", "name": name}
@@ -614,78 +728,141 @@ async def websocket_overlay_endpoint(websocket: WebSocket):
     except Exception:
         overlay_manager.disconnect(websocket)
 
+# Strategies are stateless, so one instance of each is shared.
+_DIRECT_STRATEGY = DirectStrategy()
+_INCREMENTAL_STRATEGY = IncrementalStrategy()
+
+# Compact binary control frames for /ws, accepted alongside JSON text:
+#   0x01 <throttle yaw pitch roll: 4 x float32 LE>  axes, absolute mode
+#   0x02 <throttle yaw pitch roll: 4 x float32 LE>  axes, incremental mode
+#   0x03 takeoff, 0x04 land, 0x05 emergency stop
+_BIN_AXES = struct.Struct("<ffff")
+_BIN_AXES_MODES = {0x01: "abs", 0x02: "inc"}
+_BIN_COMMANDS = {0x03: "takeoff", 0x04: "land", 0x05: "estop"}
+
+
+def _decode_binary_control(buf: bytes) -> Optional[dict[str, Any]]:
+    """Map a binary /ws frame onto the JSON message shape, or None if invalid."""
+    if not buf:
+        return None
+    opcode = buf[0]
+    mode = _BIN_AXES_MODES.get(opcode)
+    if mode is not None:
+        if len(buf) < 1 + _BIN_AXES.size:
+            return None
+        throttle, yaw, pitch, roll = _BIN_AXES.unpack_from(buf, 1)
+        return {"type": "axes", "mode": mode, "throttle": throttle, "yaw": yaw, "pitch": pitch, "roll": roll}
+    command = _BIN_COMMANDS.get(opcode)
+    if command is not None:
+        return {"type": command}
+    return None
+
+
+def _handle_axes(fc: FlightController, data: dict[str, Any]) -> None:
+    # If any plugin is running, completely ignore frontend control commands
+    # Frontend should already be suppressing these, but this is a safety check
+    if plugin_manager and plugin_manager.running():
+        return
+
+    mode = data.get("mode", "abs")
+    # Switch strategy based on mode (treat "mouse" as absolute)
+    strategy = _DIRECT_STRATEGY if mode in ("abs", "mouse") else _INCREMENTAL_STRATEGY
+    try:
+        if fc.model.strategy is not strategy:
+            fc.model.set_strategy(strategy)
+    except Exception:
+        pass
+
+    throttle = float(data.get("throttle", 0))
+    yaw      = float(data.get("yaw", 0))
+    pitch    = float(data.get("pitch", 0))
+    roll     = float(data.get("roll", 0))
+
+    fc.set_axes_from("frontend", throttle, yaw, pitch, roll)
+    _apply_camera_tilt_command(fc.model, data)
+
+
+def _handle_set_profile(fc: FlightController, data: dict[str, Any]) -> None:
+    try:
+        fc.model.set_profile(data.get("name", "normal"))
+    except Exception:
+        pass
+
+
+def _handle_set_speed_index(fc: FlightController, data: dict[str, Any]) -> None:
+    try:
+        fc.model.set_speed_index(data.get("speed_index", data.get("value", 2)))
+    except Exception:
+        pass
+
+
+def _handle_takeoff(fc: FlightController, data: dict[str, Any]) -> None:
+    try:
+        fc.model.takeoff()
+    except Exception:
+        pass
+
+
+def _handle_land(fc: FlightController, data: dict[str, Any]) -> None:
+    try:
+        fc.model.land()
+    except Exception:
+        pass
+
+
+def _handle_estop(fc: FlightController, data: dict[str, Any]) -> None:
+    try:
+        fc.model.emergency_stop()
+    except Exception:
+        try:
+            fc.model.stop_flag = True
+        except Exception:
+            pass
+
+
+def _handle_camera_tilt(fc: FlightController, data: dict[str, Any]) -> None:
+    try:
+        _apply_camera_tilt_command(fc.model, data)
+    except Exception:
+        pass
+
+
+# /ws message type -> handler. One dict lookup per message instead of an
+# if/elif chain of string comparisons.
+_CONTROL_HANDLERS = {
+    "axes": _handle_axes,
+    "set_profile": _handle_set_profile,
+    "set_speed_index": _handle_set_speed_index,
+    "speed_index": _handle_set_speed_index,
+    "takeoff": _handle_takeoff,
+    "land": _handle_land,
+    "estop": _handle_estop,
+    "emergency_stop": _handle_estop,
+    "set_camera_tilt": _handle_camera_tilt,
+    "camera_tilt": _handle_camera_tilt,
+}
+
+
 @app.websocket("/ws")
 async def ws_endpoint(websocket: WebSocket) -> None:
     await websocket.accept()
     try:
         while True:
-            data = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes") is not None:
+                data = _decode_binary_control(message["bytes"])
+                if data is None:
+                    continue
+            else:
+                data = orjson.loads(message["text"])
             if not flight_controller:
                 continue
 
-            msg_type = data.get("type")
-            if msg_type == "axes":
-                mode = data.get("mode", "abs")
-
-                # If any plugin is running, completely ignore frontend control commands
-                # Frontend should already be suppressing these, but this is a safety check
-                plugin_running = bool(plugin_manager and plugin_manager.running())
-
-                if plugin_running:
-                    # Plugin has full control - don't process frontend axes at all
-                    pass
-                else:
-                    # Switch strategy based on mode (treat "mouse" as absolute)
-                    try:
-                        if mode in ("abs", "mouse"):
-                            if not isinstance(flight_controller.model.strategy, DirectStrategy):
-                                flight_controller.model.set_strategy(DirectStrategy())
-                        else:
-                            if not isinstance(flight_controller.model.strategy, IncrementalStrategy):
-                                flight_controller.model.set_strategy(IncrementalStrategy())
-                    except Exception:
-                        pass
-
-                    throttle = float(data.get("throttle", 0))
-                    yaw      = float(data.get("yaw", 0))
-                    pitch    = float(data.get("pitch", 0))
-                    roll     = float(data.get("roll", 0))
-                    
-                    flight_controller.set_axes_from("frontend", throttle, yaw, pitch, roll)
-                    _apply_camera_tilt_command(flight_controller.model, data)
-            elif msg_type == "set_profile":
-                try:
-                    flight_controller.model.set_profile(data.get("name", "normal"))
-                except Exception:
-                    pass
-            elif msg_type in ("set_speed_index", "speed_index"):
-                try:
-                    flight_controller.model.set_speed_index(data.get("speed_index", data.get("value", 2)))
-                except Exception:
-                    pass
-            elif msg_type == "takeoff":
-                try:
-                    flight_controller.model.takeoff()
-                except Exception:
-                    pass
-            elif msg_type == "land":
-                try:
-                    flight_controller.model.land()
-                except Exception:
-                    pass
-            elif msg_type in ("estop", "emergency_stop"):
-                try:
-                    flight_controller.model.emergency_stop()
-                except Exception:
-                    try:
-                        flight_controller.model.stop_flag = True
-                    except Exception:
-                        pass
-            elif msg_type in ("set_camera_tilt", "camera_tilt"):
-                try:
-                    _apply_camera_tilt_command(flight_controller.model, data)
-                except Exception:
-                    pass
+            handler = _CONTROL_HANDLERS.get(data.get("type"))
+            if handler is not None:
+                handler(flight_controller, data)
     except WebSocketDisconnect:
         logger.info("[WebSocket] Client disconnected")
     except Exception as e:
@@ -697,33 +874,29 @@ async def ws_endpoint(websocket: WebSocket) -> None:
 
 def _frame_pump_worker(
     raw_q: queue.Queue,
-    plugin_q: Optional[queue.Queue],
     frame_hub: FrameHub,
     stop_event: threading.Event,
     loop: asyncio.AbstractEventLoop,
 ):
     """
     This worker runs in a separate thread and pumps frames from the
-    thread-safe queue to the asyncio queues.
+    thread-safe queue to the frame hub (MJPEG clients and plugins).
     """
     # Wait for the very first frame before starting keepalive, to avoid
     # prematurely closing the MJPEG stream during initial connection.
     first_frame_seen = False
-    last_frame_time = time.monotonic()
     timed_out = False
     while not stop_event.is_set() and not first_frame_seen:
         try:
             frame = raw_q.get(timeout=5.0)
             if frame:
                 first_frame_seen = True
-                last_frame_time = time.monotonic()
-                # Send to MJPEG/overlay pipelines immediately
-                asyncio.run_coroutine_threadsafe(frame_hub.publish(frame.data), loop)
-                if plugin_q is not None:
-                    try:
-                        plugin_q.put_nowait(frame)
-                    except queue.Full:
-                        pass
+                # Send to MJPEG/plugin consumers immediately
+                try:
+                    frame_hub.publish_threadsafe(frame, loop)
+                except RuntimeError:
+                    # Event loop already closed (shutdown in progress).
+                    pass
                 break
         except queue.Empty:
             # keep waiting for initial frame without killing the stream
@@ -731,28 +904,27 @@ def _frame_pump_worker(
 
     # After frames start flowing, if the stream stalls for too long we close
     # existing MJPEG clients by publishing None. (Pump continues regardless.)
-    stream_timeout_s = 3.0
+    # Each empty get below waits 1 s, so counting them measures the stall
+    # without reading the clock on every frame.
+    stale_after_ticks = 3
+    empty_ticks = 0
     while not stop_event.is_set():
         try:
             frame = raw_q.get(timeout=1.0)
             if frame:
-                last_frame_time = time.monotonic()
+                empty_ticks = 0
                 timed_out = False
                 try:
-                    asyncio.run_coroutine_threadsafe(frame_hub.publish(frame.data), loop)
-                except Exception:
+                    frame_hub.publish_threadsafe(frame, loop)
+                except RuntimeError:
                     pass
-                if plugin_q is not None:
-                    try:
-                        plugin_q.put_nowait(frame)
-                    except queue.Full:
-                        pass
         except queue.Empty:
-            if first_frame_seen and not timed_out and (time.monotonic() - last_frame_time) > stream_timeout_s:
+            empty_ticks += 1
+            if first_frame_seen and not timed_out and empty_ticks >= stale_after_ticks:
                 timed_out = True
                 try:
-                    asyncio.run_coroutine_threadsafe(frame_hub.publish(None), loop)
-                except Exception:
+                    frame_hub.publish_threadsafe(None, loop)
+                except RuntimeError:
                     pass
             continue
 
@@ -764,61 +936,106 @@ async def mjpeg_stream():
     from fastapi.responses import StreamingResponse
     
     async def frame_generator():
-        q = await FRAME_HUB.register()
+        slot = FRAME_HUB.register()
         try:
             while True:
-                frame = await q.get()
-                if frame is None:
+                part = await slot.get()
+                if part is None:
                     break
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame + b"\r\n"
-                )
+                yield part
         finally:
-            await FRAME_HUB.unregister(q)
+            FRAME_HUB.unregister(slot)
 
     return StreamingResponse(
         frame_generator(), media_type="multipart/x-mixed-replace; boundary=frame"
     )
 
 class OverlayBroadcaster:
-    def __init__(self, q: queue.Queue, loop: asyncio.AbstractEventLoop):
-        self.q = q
+    """
+    Relays plugin overlays to /ws/overlays clients from an event-loop task.
+
+    Plugin threads hand overlays over with put_nowait(), the same call they
+    used on the old overlay queue. Only the newest snapshot is kept and the
+    loop is woken with call_soon_threadsafe, so there is no relay thread and
+    no blocking round-trip per overlay.
+    """
+    # Plugins can publish overlays far faster than anyone can see them; cap
+    # pushes to clients at ~30 Hz.
+    MIN_INTERVAL_S = 0.033
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
         self.loop = loop
-        self.thread: Optional[threading.Thread] = None
-        self.stop_event = threading.Event()
+        self._latest: deque = deque(maxlen=1)
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._last_sent = 0.0
+
+    def put_nowait(self, data) -> None:
+        """Publish an overlay snapshot. Safe to call from any thread."""
+        self._latest.append(data)
+        try:
+            self.loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            # Event loop already closed (shutdown in progress).
+            pass
 
     def start(self):
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
+        self._task = self.loop.create_task(self._run())
 
-    def stop(self):
-        self.stop_event.set()
-        if self.thread:
-            self.thread.join(timeout=1.0)
-
-    def _run(self):
-        while not self.stop_event.is_set():
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
             try:
-                data = self.q.get(timeout=0.1)
-                # IMPORTANT: empty overlays are sent as [] and must still be broadcast,
-                # otherwise the frontend will keep rendering the last overlay forever.
-                if data is None:
-                    continue
+                await self._task
+            except asyncio.CancelledError:
+                pass
 
-                # Plugins typically put python objects (lists/dicts) into this queue.
-                # The frontend expects JSON. IMPORTANT: decide which coroutine to create
-                # BEFORE constructing it, otherwise an un-awaited coroutine may be
-                # garbage-collected (RuntimeWarning: coroutine was never awaited).
-                if isinstance(data, (str, bytes)):
-                    msg = data if isinstance(data, str) else data.decode("utf-8", errors="ignore")
-                    coro = overlay_manager.broadcast(msg)
-                else:
-                    coro = overlay_manager.broadcast_json(data)
-
-                future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-                future.result(timeout=1.0)
-            except queue.Empty:
+    @staticmethod
+    def _to_message(data) -> str:
+        # Plugins typically publish python objects (lists/dicts). The
+        # frontend expects JSON.
+        if isinstance(data, str):
+            return data
+        if isinstance(data, bytes):
+            return data.decode("utf-8", errors="ignore")
+        return _encode_json(data)
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            # Inside the coalesce window, hold off; anything published
+            # meanwhile replaces the pending snapshot.
+            wait = self._last_sent + self.MIN_INTERVAL_S - self.loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                data = self._latest.popleft()
+            except IndexError:
+                continue
+            # IMPORTANT: empty overlays are sent as [] and must still be broadcast,
+            # otherwise the frontend will keep rendering the last overlay forever.
+            if data is None:
                 continue
+            self._last_sent = self.loop.time()
+            try:
+                await overlay_manager.broadcast(self._to_message(data))
             except Exception as e:
                 logger.exception("[OverlayBroadcaster] Error: %s", e)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # The frontend expects the backend on localhost:8000. With
+    # uvicorn[standard] installed, "auto" resolves to uvloop and httptools
+    # (plain asyncio/h11 where uvloop isn't available, e.g. Windows). Drone
+    # state is process-global, so this must stay a single worker.
+    uvicorn.run(
+        app,
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="auto",
+        http="auto",
+        ws_per_message_deflate=False,
+        workers=1,
+    )
@@ -17,13 +17,18 @@ H: toggle headless mode
 1,2 : camera selection. barely works.
 
 '''
+import logging
+import os
 import sys
 import socket
 import cv2
+import numpy as np
 import time # Import time for delays
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QMessageBox
-from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot, Qt, QByteArray, QTimer
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot, Qt, QByteArray, QTimer, QPointF, QElapsedTimer, QMutex, QWaitCondition
+
+logger = logging.getLogger("test_e88pro")
 
 # --- Constants ---
 RTSP_URL = "rtsp://192.168.1.1:7070/webcam"
@@ -33,15 +38,25 @@ UDP_LISTEN_PORT = 7099 # Port for listening to responses (assuming same port for
 UDP_UP_COMMAND = b'\x06\x01'  # Byte sequence for UP command
 UDP_DOWN_COMMAND = b'\x06\x02' # Byte sequence for DOWN command
 UDP_BUFFER_SIZE = 1024 # Buffer size for UDP receive
+UDP_MAX_BATCH = 32 # Max datagrams drained per wake-up of the UDP listener
+# Qt >= 5.14 can wrap OpenCV's BGR frames directly, without a BGR->RGB pass
+HAS_QT_BGR888 = hasattr(QImage, "Format_BGR888")
 STREAM_REINITIALIZE_DELAY_SEC = 2 # Delay before attempting to re-open stream after disruption
+MAX_STALE_GRABS = 4 # Extra already-buffered frames to skip before decoding one
+STALE_GRAB_SEC = 0.002 # A grab returning faster than this was already buffered
+# FFmpeg options for OpenCV's RTSP backend: no demuxer buffering, minimal probing
+FFMPEG_CAPTURE_OPTIONS = os.getenv(
+    "E88PRO_FFMPEG_OPTIONS",
+    "rtsp_transport;udp|fflags;nobuffer|flags;low_delay|probesize;32|analyzeduration;0|max_delay;100000",
+)
 
 # --- Video Stream Thread ---
 class VideoStreamThread(QThread):
     """
     A QThread subclass to handle video capture from an RTSP stream.
-    It emits a QPixmap signal for each new frame.
+    It emits a QImage signal for each new frame.
     """
-    change_pixmap_signal = pyqtSignal(QPixmap)
+    change_image_signal = pyqtSignal(QImage)
     error_signal = pyqtSignal(str)
 
     def __init__(self, rtsp_url):
@@ -51,14 +66,21 @@ class VideoStreamThread(QThread):
         self._reinitialize_flag = False # New flag to trigger stream re-initialization
         self._cap = None
         self._paused = False
+        self._pause_mutex = QMutex()
+        self._pause_cond = QWaitCondition() # Parks run() while paused
+        self._rgb_buf = None # BGR->RGB scratch buffer, only used when Qt lacks Format_BGR888
 
     def run(self):
         """
-        Main loop for video capture. Reads frames and emits them as QPixmap.
+        Main loop for video capture. Reads frames and emits them as QImage.
         Handles stream opening, reading, and re-initialization.
         """
         while self._run_flag:
             if self._paused:
+                self._pause_mutex.lock()
+                while self._paused and self._run_flag:
+                    self._pause_cond.wait(self._pause_mutex)
+                self._pause_mutex.unlock()
                 continue
             if self._reinitialize_flag:
                 # If re-initialization is requested, release current capture and prepare to re-open
@@ -71,7 +93,9 @@ class VideoStreamThread(QThread):
 
             if not self._cap or not self._cap.isOpened():
                 print(f"Attempting to open RTSP stream: {self._rtsp_url}")
-                self._cap = cv2.VideoCapture(self._rtsp_url)
+                os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = FFMPEG_CAPTURE_OPTIONS
+                self._cap = cv2.VideoCapture(self._rtsp_url, cv2.CAP_FFMPEG)
+                self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                 if not self._cap.isOpened():
                     self.error_signal.emit(f"Error: Could not open RTSP stream at {self._rtsp_url}. "
                                            "Please check the URL and network connection.")
@@ -80,20 +104,31 @@ class VideoStreamThread(QThread):
 
                 print("RTSP stream opened successfully.")
 
-            # Attempt to read a frame
-            ret, cv_img = self._cap.read()
+            # Wait for the next frame, then skip any that were already buffered
+            # behind it so we always decode and display the newest one
+            ret = self._cap.grab()
+            if ret:
+                for _ in range(MAX_STALE_GRABS):
+                    t0 = time.perf_counter()
+                    if not self._cap.grab() or time.perf_counter() - t0 > STALE_GRAB_SEC:
+                        break
+                ret, cv_img = self._cap.retrieve()
             if ret:
-                # Convert OpenCV image to QPixmap
-                qt_format = QImage.Format_RGB888
+                # Convert OpenCV image to QImage
                 if len(cv_img.shape) == 3 and cv_img.shape[2] == 3: # Check if it's a color image
-                    rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-                    # Rotate the image 90 degrees clockwise
-                    rgb_image = cv2.rotate(rgb_image, cv2.ROTATE_90_CLOCKWISE)
-                    h, w, ch = rgb_image.shape
-                    bytes_per_line = ch * w
-                    convert_to_qt_format = QImage(rgb_image.data, w, h, bytes_per_line, qt_format)
-                    p = convert_to_qt_format.scaled(640, 480, Qt.KeepAspectRatio) # Scale for display
-                    self.change_pixmap_signal.emit(QPixmap.fromImage(p))
+                    if HAS_QT_BGR888:
+                        qt_format = QImage.Format_BGR888
+                    else:
+                        if self._rgb_buf is None or self._rgb_buf.shape != cv_img.shape:
+                            self._rgb_buf = np.empty_like(cv_img)
+                        cv_img = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                        qt_format = QImage.Format_RGB888
+                    h, w, ch = cv_img.shape
+                    # QImage wraps the frame without copying; copy() detaches it from the
+                    # numpy buffer before it crosses threads. QPixmap is GUI-thread only, so
+                    # VideoLabel paints the QImage itself, rotating and scaling as it draws.
+                    image = QImage(cv_img.data, w, h, ch * w, qt_format)
+                    self.change_image_signal.emit(image.copy())
                 else:
                     print("Warning: Received non-RGB image, skipping display.")
             else:
@@ -104,16 +139,31 @@ class VideoStreamThread(QThread):
                 if self._cap: # Release immediately to avoid blocking
                     self._cap.release()
                     self._cap = None
-            self.msleep(30) # Small delay to prevent busy-waiting and reduce CPU usage
 
         print("Video stream thread stopping.")
         if self._cap:
             self._cap.release()
             print("RTSP stream released.")
 
+    def pause(self):
+        """Parks the capture loop until resume() is called."""
+        self._pause_mutex.lock()
+        self._paused = True
+        self._pause_mutex.unlock()
+
+    def resume(self):
+        """Wakes the capture loop after pause()."""
+        self._pause_mutex.lock()
+        self._paused = False
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
+
     def stop(self):
         """Stops the video stream thread gracefully."""
+        self._pause_mutex.lock()
         self._run_flag = False
+        self._pause_cond.wakeAll() # Let a paused loop see the stop
+        self._pause_mutex.unlock()
         self.wait() # Wait for the thread to finish its execution
 
     @pyqtSlot()
@@ -126,13 +176,49 @@ class VideoStreamThread(QThread):
         print("Re-initialization requested for video stream.")
 
 
+# --- Video Display Widget ---
+class VideoLabel(QLabel):
+    """
+    A QLabel that paints video frames rotated 90 degrees clockwise and scaled
+    to fit, keeping the aspect ratio. Rotation and scaling happen in the same
+    blit at paint time, so no rotated or scaled copy of the frame is made.
+    Setting non-empty text (loading/error messages) clears the frame.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame = None
+
+    def set_frame(self, image):
+        self._frame = image
+        self.update()
+
+    def setText(self, text):
+        if text:
+            self._frame = None
+        super().setText(text)
+
+    def paintEvent(self, event):
+        super().paintEvent(event) # Background, border and any text
+        if self._frame is None:
+            return
+        w, h = self._frame.width(), self._frame.height()
+        scale = min(self.width() / h, self.height() / w) # Rotated: h across, w down
+        painter = QPainter(self)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.rotate(90)
+        painter.scale(scale, scale)
+        painter.drawImage(QPointF(-w / 2, -h / 2), self._frame)
+        painter.end()
+
+
 # --- UDP Listener Thread ---
 class UDPListenerThread(QThread):
     """
     A QThread subclass to listen for incoming UDP data.
-    It emits a signal with the received data.
+    It emits a signal with the datagrams received per wake-up.
     """
-    data_received_signal = pyqtSignal(bytes, tuple) # Signal to emit data and sender address
+    data_received_signal = pyqtSignal(list) # Signal to emit a list of (data, sender address)
     error_signal = pyqtSignal(str)
 
     def __init__(self, port, buffer_size):
@@ -161,9 +247,20 @@ class UDPListenerThread(QThread):
 
         while self._run_flag:
             try:
-                data, addr = self._sock.recvfrom(self._buffer_size)
-                self.data_received_signal.emit(data, addr)
-                print(f"Received UDP data from {addr}: {data.hex()}")
+                batch = [self._sock.recvfrom(self._buffer_size)]
+                # Drain whatever else is already queued without blocking
+                self._sock.settimeout(0.0)
+                try:
+                    for _ in range(UDP_MAX_BATCH - 1):
+                        batch.append(self._sock.recvfrom(self._buffer_size))
+                except BlockingIOError:
+                    pass
+                finally:
+                    self._sock.settimeout(1.0)
+                self.data_received_signal.emit(batch)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for data, addr in batch:
+                        logger.debug("Received UDP data from %s: %s", addr, data.hex())
             except socket.timeout:
                 # Timeout occurred, continue loop to check _run_flag
                 pass
@@ -193,8 +290,24 @@ class RTSPViewerApp(QMainWindow):
     """
     Main application window for RTSP viewing and UDP control.
     """
+    # Offsets into basebytes: 0x66, roll, pitch, throttle, yaw, flags, checksum, 0x99
+    ROLL, PITCH, THROTTLE, YAW, FLAGS, CHECKSUM = range(1, 7)
+    # Stick keys -> (offset, direction)
+    STICK_KEYS = {
+        Qt.Key_Up: (PITCH, +1), # Forward (pitch down)
+        Qt.Key_Down: (PITCH, -1), # Back (pitch up)
+        Qt.Key_Left: (ROLL, -1),
+        Qt.Key_Right: (ROLL, +1),
+        Qt.Key_W: (THROTTLE, +1),
+        Qt.Key_S: (THROTTLE, -1),
+        Qt.Key_D: (YAW, +1),
+        Qt.Key_A: (YAW, -1),
+    }
+    # Bits in the FLAGS byte
     SOMERSAULT = 8
     HEADLESS = 16
+    # Camera switch steps, advanced by single-shot timers so send() never blocks
+    CAM_IDLE, CAM_PAUSED, CAM_SWITCHED = range(3)
     def __init__(self):
         super().__init__()
         self.setWindowTitle("RTSP Stream Viewer & Device Control")
@@ -205,7 +318,7 @@ class RTSPViewerApp(QMainWindow):
         self.layout = QVBoxLayout(self.central_widget)
 
         # Video display label
-        self.image_label = QLabel(self)
+        self.image_label = VideoLabel(self)
         self.image_label.setFixedSize(640, 480) # Fixed size for video display
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.setStyleSheet("background-color: black; border: 1px solid gray;")
@@ -213,6 +326,19 @@ class RTSPViewerApp(QMainWindow):
         self.flip=False
         self.headless=False
         self.cam=0
+        self._cam_state = self.CAM_IDLE
+        self._held_keys = set() # Stick keys currently down
+        self._pressed_keys = set() # Stick keys pressed since the last tick, so quick taps count
+        # One-shot keys -> action
+        self._key_actions = {
+            Qt.Key_Z: lambda: self._set_flags(1), # Takeoff
+            Qt.Key_X: lambda: self._set_flags(2), # Land
+            Qt.Key_C: lambda: self._set_flags(128), # Calibrate
+            Qt.Key_F: self._start_flip, # Flip 360
+            Qt.Key_H: self._toggle_headless,
+            Qt.Key_1: lambda: self._select_cam(1),
+            Qt.Key_2: lambda: self._select_cam(2),
+        }
 
         # Control buttons
         self.up_button = QPushButton("UP")
@@ -236,7 +362,7 @@ class RTSPViewerApp(QMainWindow):
         video = True
         if video:
             self.video_thread = VideoStreamThread(RTSP_URL)
-            self.video_thread.change_pixmap_signal.connect(self.update_image)
+            self.video_thread.change_image_signal.connect(self.update_image)
             self.video_thread.error_signal.connect(self.show_error_message)
             self.video_thread.start()
 
@@ -251,6 +377,12 @@ class RTSPViewerApp(QMainWindow):
         self.image_label.setStyleSheet("background-color: black; color: white; border: 1px solid gray;")
 
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM) # UDP socket
+        try:
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10) # Low-delay TOS
+        except OSError:
+            pass # Not supported on every platform
+        self._dst = (UDP_IP, UDP_SEND_PORT)
+        self._connected = False # Connected lazily so a missing drone network is retried
 
         # Ensure the widget itself can receive key press events
         # We also want it to be able to re-gain focus after buttons are clicked
@@ -260,117 +392,121 @@ class RTSPViewerApp(QMainWindow):
         self.decel = 5
         self.send_udp_command(b'\x08\x01')
         self.timer = QTimer(self)
-        self.last_heartbeat = time.time()
+        self._heartbeat_timer = QElapsedTimer() # Monotonic; no wall-clock jumps
+        self._heartbeat_timer.start()
         self.timer.timeout.connect(self.send)  # Connect the timeout signal to the update method
         self.timer.start(30)  # Start the timer with an interval
         #byte0:102,byte1:128,byte2:128,byte3:128,byte4:128,byte5:0,byte6:0,byte7:153
         self.basebytes = bytearray(b'\x66\x80\x80\x80\x80\x00\x00\x99')
+        # Control packet sent every tick: 0x03 followed by basebytes, reused in place
+        self._tx_buf = bytearray(1 + len(self.basebytes))
+        self._tx_buf[0] = 0x03
 
     def send(self):
+        self._apply_stick_keys()
         if self.flip:
-            self.basebytes[5]+=self.SOMERSAULT
+            self.basebytes[self.FLAGS]+=self.SOMERSAULT
         if self.headless:
-            self.basebytes[5]+=self.HEADLESS
-        self.send_udp_command(bytes(bytearray(b'\x03') + self.basebytes))
-        if time.time() - self.last_heartbeat > 1:
+            self.basebytes[self.FLAGS]+=self.HEADLESS
+        self.xor(self.basebytes)
+        self._tx_buf[1:] = self.basebytes
+        self.send_udp_command(self._tx_buf)
+        if self._heartbeat_timer.hasExpired(1000):
             self.send_udp_command(b'\x01\x01')
-            self.last_heartbeat = time.time()
-        if self.cam>0:
-            self.video_thread._paused = True
-            time.sleep(1)
-            l = bytearray(b'\x06')
-            l.append(self.cam)
-            self.send_udp_command(bytes(l))
-            self.cam=0
-            time.sleep(1)
-            self.video_thread._paused = False
-            self.video_thread.reinitialize_stream()
-
-
-        self.basebytes[5] = 0 
-        for a in range(1,5):
-            if (self.basebytes[a]>128):
-                self.basebytes[a]-=self.decel
-            elif (self.basebytes[a]<128):
-                self.basebytes[a]+=self.decel
+            self._heartbeat_timer.restart()
+        if self.cam>0 and self._cam_state == self.CAM_IDLE:
+            self._cam_state = self.CAM_PAUSED
+            self.video_thread.pause()
+            QTimer.singleShot(1000, self._cam_send_switch)
+
 
+        self.basebytes[self.FLAGS] = 0 
+        # Ease each stick back towards centre (128): the sign comes from
+        # (v < 128) - (v > 128), which is +1, -1 or 0, with no branches
+        decel = self.decel
+        self.basebytes[self.ROLL:self.FLAGS] = bytes(
+            [v + ((v < 128) - (v > 128)) * decel for v in self.basebytes[self.ROLL:self.FLAGS]]
+        )
+
+
+    def _cam_send_switch(self):
+        """Second camera-switch step: send the switch command once video is paused."""
+        self.send_udp_command(bytes((0x06, self.cam)))
+        self.cam=0
+        self._cam_state = self.CAM_SWITCHED
+        QTimer.singleShot(1000, self._cam_resume_stream)
+
+    def _cam_resume_stream(self):
+        """Last camera-switch step: resume video and reopen the stream."""
+        self.video_thread.resume()
+        self.video_thread.reinitialize_stream()
+        self._cam_state = self.CAM_IDLE
 
     def xor(self,bs):
-        s=0
-        for byte_value in bs[1:6]:
-            s ^= byte_value
-        bs[6]=s
+        # Checksum byte 6 = XOR of bytes 1..5, folded from one 40-bit int
+        x = int.from_bytes(bs[self.ROLL:self.CHECKSUM], 'little')
+        bs[self.CHECKSUM] = (x ^ (x >> 8) ^ (x >> 16) ^ (x >> 24) ^ (x >> 32)) & 0xff
         return bs
 
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Up: #Forward (pitch down)
-            if self.basebytes[2]<200:
-                self.basebytes[2]+=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_Down: #Back (pitch up)
-            if self.basebytes[2]>50:
-                self.basebytes[2]-=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_Left: #Roll left
-            if self.basebytes[1]>50:
-                self.basebytes[1]-=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_Right: #Roll right
-            if self.basebytes[1]<200:
-                self.basebytes[1]+=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_W:
-            if self.basebytes[3]<200:
-                self.basebytes[3]+=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_S:
-            if self.basebytes[3]>50:
-                self.basebytes[3]-=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_D:
-            if self.basebytes[4]<200:
-                self.basebytes[4]+=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_A:
-            if self.basebytes[4]>50:
-                self.basebytes[4]-=self.accel
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_Z: #Takeoff
-            self.basebytes[5] = 1
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_X: #Land
-            self.basebytes[5] = 2
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_C: #Calibrate
-            self.basebytes[5] = 128 
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_F: #Flip 360
-            self.flip = True
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_H: #Headless
-            self.headless = not self.headless
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_1: #cam 1
-            self.cam=1
-            event.accept()  # Crucial: tell PyQt we handled this event
-        elif event.key() == Qt.Key_2: #cam 2
-            self.cam=2
+        key = event.key()
+        if event.isAutoRepeat():
+            # Held stick keys are applied once per control tick in send()
+            event.accept()
+        elif key in self.STICK_KEYS:
+            self._held_keys.add(key)
+            self._pressed_keys.add(key)
             event.accept()  # Crucial: tell PyQt we handled this event
+        elif key in self._key_actions:
+            self._key_actions[key]()
+            event.accept()
         else:
             # For other keys, let the default behavior happen
-            print(event.key())
+            logger.debug("Unhandled key %s", key)
             super().keyPressEvent(event)
 
+    def _set_flags(self, value):
+        self.basebytes[self.FLAGS] = value
+
+    def _start_flip(self):
+        self.flip = True
+
+    def _toggle_headless(self):
+        self.headless = not self.headless
+
+    def _select_cam(self, cam):
+        self.cam = cam
+
+    def keyReleaseEvent(self, event):
+        if not event.isAutoRepeat():
+            self._held_keys.discard(event.key())
+        event.accept()
+
+    def focusOutEvent(self, event):
+        # Key releases are not delivered once focus is gone, so let go of the sticks
+        self._held_keys.clear()
+        super().focusOutEvent(event)
+
+    def _apply_stick_keys(self):
+        """Moves each stick once for every key held (or tapped) since the last tick."""
+        for key in self._held_keys | self._pressed_keys:
+            offset, direction = self.STICK_KEYS[key]
+            value = self.basebytes[offset]
+            if (value < 200) if direction > 0 else (value > 50):
+                self.basebytes[offset] = value + direction * self.accel
+        self._pressed_keys.clear()
+
 
-    @pyqtSlot(QPixmap)
-    def update_image(self, pixmap):
+    @pyqtSlot(QImage)
+    def update_image(self, image):
         """Slot to update the QLabel with new video frames."""
-        self.image_label.setPixmap(pixmap)
+        self.image_label.set_frame(image)
         self.image_label.setText("") # Clear loading text once video starts
 
-    @pyqtSlot(bytes, tuple)
-    def update_udp_response(self, data, addr):
-        """Slot to update the QLabel with received UDP data."""
+    @pyqtSlot(list)
+    def update_udp_response(self, batch):
+        """Slot to update the QLabel with the latest received UDP data."""
+        data, addr = batch[-1]
         self.udp_response_label.setText(f"UDP Response from {addr[0]}:{addr[1]}: {data.hex()}")
 
     @pyqtSlot(str)
@@ -390,7 +526,10 @@ class RTSPViewerApp(QMainWindow):
     def send_udp_command(self, command):
         """Sends a UDP command to the specified IP and port."""
         try:
-            self.sock.sendto(command, (UDP_IP, UDP_SEND_PORT))
+            if not self._connected:
+                self.sock.connect(self._dst)
+                self._connected = True
+            self.sock.send(command)
             #print(f"Sent UDP command: {command.hex()} to {UDP_IP}:{UDP_SEND_PORT}")
         except socket.error as e:
             #QMessageBox.warning(self, "Network Error", f"Failed to send UDP command: {e}")
@@ -419,6 +558,10 @@ class RTSPViewerApp(QMainWindow):
 
 # --- Main execution ---
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG if os.getenv("E88PRO_DEBUG") else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
     app = QApplication(sys.argv)
     window = RTSPViewerApp()
     window.show()